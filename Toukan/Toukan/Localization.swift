@@ -235,6 +235,9 @@ struct Strings: Sendable {
     func uploadFailedDetail(name: String, detail: String) -> String {
         ja ? "アップロード失敗: \(name) — \(detail)" : "Upload failed: \(name) — \(detail)"
     }
+    func alreadyUploaded(name: String) -> String {
+        ja ? "アップロード済み（未変更）、アーカイブのみ再試行: \(name)" : "Already uploaded and unchanged, retrying archive only: \(name)"
+    }
     func archiveSuccess(name: String) -> String {
         ja ? "アーカイブ完了: \(name)" : "Archived: \(name)"
     }
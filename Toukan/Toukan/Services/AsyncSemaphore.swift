@@ -0,0 +1,51 @@
+import Foundation
+
+// MARK: - AsyncSemaphore
+
+/// A counting semaphore for Swift concurrency.
+///
+/// Limits how many tasks may run a section of async work at the same time.
+/// Waiters suspend (rather than block a thread) and are resumed in FIFO order
+/// as permits are released.
+///
+/// Every successful ``wait()`` must be balanced by exactly one ``signal()``.
+actor AsyncSemaphore {
+
+    // MARK: Private State
+
+    /// Number of permits currently available.
+    private var available: Int
+
+    /// Suspended callers waiting for a permit, oldest first.
+    private var waiters: [CheckedContinuation<Void, Never>] = []
+
+    // MARK: Init
+
+    /// - Parameter limit: Maximum number of concurrent permit holders. Must be > 0.
+    init(limit: Int) {
+        precondition(limit > 0, "AsyncSemaphore limit must be positive")
+        self.available = limit
+    }
+
+    // MARK: Public API
+
+    /// Acquires a permit, suspending until one becomes available.
+    func wait() async {
+        if available > 0 {
+            available -= 1
+            return
+        }
+        await withCheckedContinuation { continuation in
+            waiters.append(continuation)
+        }
+    }
+
+    /// Releases a permit, handing it directly to the oldest waiter if any.
+    func signal() {
+        if waiters.isEmpty {
+            available += 1
+        } else {
+            waiters.removeFirst().resume()
+        }
+    }
+}
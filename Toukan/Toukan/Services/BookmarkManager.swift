@@ -57,10 +57,24 @@ struct SyncTarget: Codable, Identifiable, Sendable {
     private let logger = Logger(subsystem: "com.clevique.Toukan", category: "Bookmark")
     private let defaultsKey = "syncTargets"
 
+    /// Whether edits are written back to UserDefaults. Off when the manager was
+    /// created without the stored targets, so it never overwrites them.
+    private let persistsTargets: Bool
+
+    /// Coders for the persisted targets array, shared rather than created per load/save.
+    private static let encoder = JSONEncoder()
+    private static let decoder = JSONDecoder()
+
     // MARK: Lifecycle
 
-    init() {
-        loadTargets()
+    /// - Parameter loadStoredTargets: Pass `false` to start with no targets
+    ///   instead of reading them from UserDefaults. Edits are then not
+    ///   persisted either.
+    init(loadStoredTargets: Bool = true) {
+        persistsTargets = loadStoredTargets
+        if loadStoredTargets {
+            loadTargets()
+        }
     }
 
     // MARK: Public Methods
@@ -168,7 +182,7 @@ struct SyncTarget: Codable, Identifiable, Sendable {
         }
 
         do {
-            let decoded = try JSONDecoder().decode([SyncTarget].self, from: data)
+            let decoded = try Self.decoder.decode([SyncTarget].self, from: data)
             targets = decoded
             logger.info("Loaded \(decoded.count, privacy: .public) sync target(s) from UserDefaults")
         } catch {
@@ -180,8 +194,9 @@ struct SyncTarget: Codable, Identifiable, Sendable {
 
     /// Persists the current targets array to UserDefaults as a JSON-encoded byte array.
     private func saveTargets() {
+        guard persistsTargets else { return }
         do {
-            let data = try JSONEncoder().encode(targets)
+            let data = try Self.encoder.encode(targets)
             UserDefaults.standard.set(data, forKey: defaultsKey)
             logger.debug("Saved \(self.targets.count, privacy: .public) sync target(s) to UserDefaults")
         } catch {
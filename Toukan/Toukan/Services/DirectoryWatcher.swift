@@ -10,11 +10,11 @@ import os
 ///
 /// ## Thread Model
 ///
-/// All mutable state (`sources`, `snapshots`) is guarded by a private serial
-/// `DispatchQueue`. Public methods synchronise on this queue, making the class
-/// safe to call from any thread. The ``Handler`` callback is invoked on the
-/// internal queue — callers that need MainActor isolation must dispatch
-/// accordingly (see ``SyncEngine/handleNewFile(_:in:)``).
+/// All mutable state (`sources`, `pollTimers`, `snapshots`, `pending`) is
+/// guarded by a private serial `DispatchQueue`. Public methods synchronise on
+/// this queue, making the class safe to call from any thread. The ``Handler``
+/// callback is invoked on the internal queue — callers that need MainActor
+/// isolation must dispatch accordingly (see ``SyncEngine/handleNewFile(_:in:)``).
 final class DirectoryWatcher: @unchecked Sendable {
 
     // MARK: Types
@@ -36,14 +36,46 @@ final class DirectoryWatcher: @unchecked Sendable {
     /// Last-known set of `.md` file names (lastPathComponent) per directory.
     private var snapshots: [URL: Set<String>] = [:]
 
+    /// Files detected but not yet delivered because they are still settling.
+    /// Editors that save atomically (write temp file, replace original) make a
+    /// file briefly vanish and reappear; this keeps such save storms from
+    /// queueing the same file more than once.
+    private var pending: Set<URL> = []
+
+    /// Fallback rescan timers for directories on network volumes, keyed like `sources`.
+    private var pollTimers: [URL: DispatchSourceTimer] = [:]
+
     /// Caller-supplied callback.
     private let handler: Handler
 
+    /// Rescan interval for directories on network volumes (SMB, NFS, AFP),
+    /// where kqueue does not report changes made by other machines.
+    private let networkPollInterval: TimeInterval
+
     private let logger = Logger(subsystem: "com.clevique.Toukan", category: "DirectoryWatcher")
 
+    /// How long a file must go unmodified before it is considered fully written.
+    private let settleInterval: TimeInterval
+
+    /// Upper bound on settle re-checks, so a file that keeps changing is still
+    /// delivered eventually rather than held back forever.
+    private static let maxSettleChecks = 20
+
     // MARK: Lifecycle
 
-    init(handler: @escaping Handler) {
+    /// - Parameters:
+    ///   - networkPollInterval: Seconds between fallback rescans of directories on
+    ///     network volumes. Kept long because each rescan lists the whole directory.
+    ///   - settleInterval: Seconds a new file must go unmodified before it is
+    ///     delivered.
+    ///   - handler: Callback invoked for every newly detected `.md` file.
+    init(
+        networkPollInterval: TimeInterval = 30,
+        settleInterval: TimeInterval = 0.5,
+        handler: @escaping Handler
+    ) {
+        self.networkPollInterval = networkPollInterval
+        self.settleInterval = settleInterval
         self.handler = handler
     }
 
@@ -54,8 +86,13 @@ final class DirectoryWatcher: @unchecked Sendable {
             for (_, source) in sources {
                 source.cancel()
             }
+            for (_, timer) in pollTimers {
+                timer.cancel()
+            }
             sources.removeAll()
+            pollTimers.removeAll()
             snapshots.removeAll()
+            pending.removeAll()
         }
     }
 
@@ -92,6 +129,8 @@ final class DirectoryWatcher: @unchecked Sendable {
             queue: queue
         )
 
+        let isLocal = (try? url.resourceValues(forKeys: [.volumeIsLocalKey]))?.volumeIsLocal ?? true
+
         // Capture the initial snapshot and install the event handler.
         queue.sync {
             guard sources[url] == nil else {
@@ -114,6 +153,21 @@ final class DirectoryWatcher: @unchecked Sendable {
 
             source.resume()
             logger.info("Started watching directory: \(url.path, privacy: .public)")
+
+            if !isLocal {
+                let timer = DispatchSource.makeTimerSource(queue: queue)
+                timer.schedule(
+                    deadline: .now() + networkPollInterval,
+                    repeating: networkPollInterval,
+                    leeway: .seconds(5)
+                )
+                timer.setEventHandler { [weak self] in
+                    self?.handleEvent(for: url)
+                }
+                timer.resume()
+                pollTimers[url] = timer
+                logger.info("\(url.path, privacy: .public) is on a network volume — also rescanning every \(self.networkPollInterval, privacy: .public)s")
+            }
         }
     }
 
@@ -144,7 +198,7 @@ final class DirectoryWatcher: @unchecked Sendable {
             let files = currentMDFiles(in: url)
             for fileName in files {
                 let fileURL = url.appendingPathComponent(fileName)
-                logger.info("Scan: existing .md file found: \(fileURL.path, privacy: .public)")
+                logger.debug("Scan: existing .md file found: \(fileURL.path, privacy: .public)")
                 handler(fileURL, url)
             }
         }
@@ -157,13 +211,14 @@ final class DirectoryWatcher: @unchecked Sendable {
         guard let source = sources.removeValue(forKey: url) else { return }
         snapshots.removeValue(forKey: url)
         source.cancel()
+        pollTimers.removeValue(forKey: url)?.cancel()
         logger.info("Stopped watching directory: \(url.path, privacy: .public)")
     }
 
     /// Called by the `DispatchSource` event handler. Must be called on `queue`.
     private func handleEvent(for directoryURL: URL) {
         let previous = snapshots[directoryURL] ?? []
-        let current = currentMDFiles(in: directoryURL)
+        let current = currentMDFiles(in: directoryURL, known: previous)
 
         let added = current.subtracting(previous)
 
@@ -177,47 +232,119 @@ final class DirectoryWatcher: @unchecked Sendable {
 
         for fileName in added {
             let fileURL = directoryURL.appendingPathComponent(fileName)
-
-            // Wait 0.5 s for the write to complete before notifying the caller,
-            // matching the behaviour of the Python watchdog implementation.
-            queue.asyncAfter(deadline: .now() + 0.5) { [weak self] in
-                guard let self else { return }
-                logger.info("New .md file ready: \(fileURL.path, privacy: .public)")
-                handler(fileURL, directoryURL)
+            guard pending.insert(fileURL).inserted else {
+                logger.debug("Already waiting on \(fileURL.path, privacy: .public) — ignoring repeat event")
+                continue
             }
+            notifyWhenSettled(fileURL, in: directoryURL)
+        }
+    }
+
+    /// Invokes the handler for `fileURL` once its writer appears to be done.
+    ///
+    /// kqueue offers no close-after-write event for directory watches, so a file
+    /// is treated as complete once its modification time is at least
+    /// ``settleInterval`` old. Files that were copied or renamed into place are
+    /// usually already settled and are delivered immediately; files still being
+    /// written are re-checked until they go quiet. Must be called on `queue`.
+    private func notifyWhenSettled(_ fileURL: URL, in directoryURL: URL, checks: Int = 0) {
+        // The directory may have been unwatched while we were waiting.
+        guard sources[directoryURL] != nil else {
+            pending.remove(fileURL)
+            return
+        }
+
+        var info = stat()
+        guard lstat(fileURL.path, &info) == 0 else {
+            // If an atomic save put it back, the next directory event reports it again.
+            pending.remove(fileURL)
+            logger.debug("File disappeared before it settled: \(fileURL.path, privacy: .public)")
+            return
+        }
+
+        let modified = TimeInterval(info.st_mtimespec.tv_sec)
+            + TimeInterval(info.st_mtimespec.tv_nsec) / 1_000_000_000
+        let quietFor = Date().timeIntervalSince1970 - modified
+
+        guard quietFor < settleInterval, checks < Self.maxSettleChecks else {
+            pending.remove(fileURL)
+            logger.debug("New .md file ready: \(fileURL.path, privacy: .public)")
+            handler(fileURL, directoryURL)
+            return
+        }
+
+        // Clamp so a modification time in the future (clock skew on network
+        // volumes) cannot stall delivery beyond one interval per check.
+        let wait = min(settleInterval, max(settleInterval - quietFor, 0.05))
+        queue.asyncAfter(deadline: .now() + wait) { [weak self] in
+            self?.notifyWhenSettled(fileURL, in: directoryURL, checks: checks + 1)
         }
     }
 
     /// Returns the set of `.md` file names (lastPathComponent) currently present
     /// directly inside `directoryURL`. Only top-level regular files with a `.md`
     /// extension are included; subdirectories (including any archive directory)
-    /// are excluded by the `isRegularFile` check. The extension check is case-insensitive.
-    private func currentMDFiles(in directoryURL: URL) -> Set<String> {
-        let fm = FileManager.default
-
-        guard let contents = try? fm.contentsOfDirectory(
-            at: directoryURL,
-            includingPropertiesForKeys: [.isRegularFileKey, .isDirectoryKey],
-            options: [.skipsHiddenFiles]
-        ) else {
-            logger.warning("contentsOfDirectory failed for \(directoryURL.path, privacy: .public)")
+    /// are excluded by the regular-file check. The extension check is case-insensitive.
+    ///
+    /// Runs on every directory event, so it works on plain names: entries are
+    /// filtered by name first and only `.md` candidates cost an `lstat(2)`.
+    /// Names in `known` were already verified by an earlier scan and are
+    /// accepted without another `lstat(2)`, so an event costs one syscall per
+    /// *new* candidate rather than per file in the directory.
+    private func currentMDFiles(in directoryURL: URL, known: Set<String> = []) -> Set<String> {
+        let directoryPath = directoryURL.path
+
+        guard let names = try? FileManager.default.contentsOfDirectory(atPath: directoryPath) else {
+            logger.warning("contentsOfDirectory failed for \(directoryPath, privacy: .public)")
             return []
         }
 
         var result = Set<String>()
-        for itemURL in contents {
-            // Only accept regular `.md` files.
-            // Subdirectories (including the archive directory) are excluded
-            // by the isRegularFile check below.
+        for name in names {
+            // Skip hidden entries and anything that is not a `.md` file by name.
             guard
-                itemURL.pathExtension.lowercased() == "md",
-                (try? itemURL.resourceValues(forKeys: [.isRegularFileKey]).isRegularFile) == true
+                !name.hasPrefix("."),
+                Self.hasMarkdownExtension(name)
             else {
                 continue
             }
 
-            result.insert(itemURL.lastPathComponent)
+            if known.contains(name) {
+                result.insert(name)
+                continue
+            }
+
+            // Only accept regular files that are not flagged hidden.
+            // Subdirectories (including the archive directory) and symlinks
+            // are excluded here.
+            var info = stat()
+            guard
+                lstat(directoryPath + "/" + name, &info) == 0,
+                info.st_mode & S_IFMT == S_IFREG,
+                info.st_flags & UInt32(UF_HIDDEN) == 0
+            else {
+                continue
+            }
+
+            result.insert(name)
         }
         return result
     }
+
+    /// Case-insensitive `.md` suffix check on the name's UTF-8 bytes.
+    ///
+    /// Equivalent to `pathExtension.lowercased() == "md"` for the names that
+    /// reach it, but compares the last three bytes in place instead of
+    /// bridging to `NSString` and allocating a lowercased copy per entry.
+    private static func hasMarkdownExtension(_ name: String) -> Bool {
+        let bytes = name.utf8
+        guard bytes.count > 3 else { return false }
+        let suffix = bytes.suffix(3)
+        var index = suffix.startIndex
+        guard suffix[index] == UInt8(ascii: ".") else { return false }
+        index = suffix.index(after: index)
+        guard suffix[index] | 0x20 == UInt8(ascii: "m") else { return false }
+        index = suffix.index(after: index)
+        return suffix[index] | 0x20 == UInt8(ascii: "d")
+    }
 }
@@ -0,0 +1,65 @@
+import Foundation
+
+// MARK: - FileArchiver
+
+/// Moves processed Markdown files out of a watched directory.
+///
+/// Kept separate from ``SyncEngine`` so the file-system side of a sync can be
+/// exercised on its own, without an API client or a running watcher.
+struct FileArchiver: Sendable {
+
+    // MARK: Public API
+
+    /// Creates `directory` (and any missing parents) if it does not exist yet.
+    ///
+    /// Called once per sync target when syncing starts, so archiving a file
+    /// normally needs no directory checks at all.
+    static func prepare(_ directory: URL) throws {
+        try FileManager.default.createDirectory(at: directory, withIntermediateDirectories: true, attributes: nil)
+    }
+
+    /// Moves `fileURL` into `directory`, replacing any file of the same name.
+    ///
+    /// The archive folder sits next to the file, so this is normally a single
+    /// atomic `rename(2)`. If the folder is missing (e.g. deleted while syncing)
+    /// it is created and the rename retried. If it lives on another volume, the
+    /// move falls back to `FileManager`, which copies and deletes.
+    ///
+    /// - Parameters:
+    ///   - fileURL:   The file to archive.
+    ///   - directory: The archive folder to move it into.
+    /// - Returns: The archived file's new location.
+    /// - Throws: A `POSIXError` from `rename(2)`, or any `FileManager` error from
+    ///   the fallback paths.
+    @discardableResult
+    static func archive(_ fileURL: URL, into directory: URL) throws -> URL {
+        let destination = directory.appendingPathComponent(fileURL.lastPathComponent)
+        if rename(fileURL.path, destination.path) == 0 {
+            return destination
+        }
+
+        let code = errno
+        switch code {
+        case ENOENT where FileManager.default.fileExists(atPath: fileURL.path):
+            try prepare(directory)
+            guard rename(fileURL.path, destination.path) == 0 else {
+                throw posixError(errno)
+            }
+        case EXDEV:
+            let fileManager = FileManager.default
+            if fileManager.fileExists(atPath: destination.path) {
+                try fileManager.removeItem(at: destination)
+            }
+            try fileManager.moveItem(at: fileURL, to: destination)
+        default:
+            throw posixError(code)
+        }
+        return destination
+    }
+
+    // MARK: Private
+
+    private static func posixError(_ code: Int32) -> POSIXError {
+        POSIXError(POSIXErrorCode(rawValue: code) ?? .EIO)
+    }
+}
@@ -2,61 +2,157 @@ import Foundation
 
 struct MarkdownParser: Sendable {
 
+    /// Heading block factories indexed by heading level − 1 (`#` → `heading_1`, …).
+    private static let headingFactories: [@Sendable (String) -> NotionBlock] = [
+        { .heading1($0) },
+        { .heading2($0) },
+        { .heading3($0) },
+    ]
+
     func parse(_ content: String) -> [NotionBlock] {
-        guard !content.trimmingCharacters(in: .whitespacesAndNewlines).isEmpty else {
-            return []
-        }
+        // Whitespace-only content needs no up-front check: every line trims to
+        // empty, so the loop below emits no blocks.
+        var content = content
+        content.makeContiguousUTF8()
 
         var blocks: [NotionBlock] = []
-        let lines = content.split(separator: "\n", omittingEmptySubsequences: false)
-        var currentParagraph: [String] = []
+        // Lines of the paragraph being built, appended straight into one buffer
+        // instead of collected as separate strings and joined at the end. Lines
+        // are never empty here, so an empty buffer means "no open paragraph".
+        var currentParagraph = ""
 
-        for rawLine in lines {
-            let line = String(rawLine).replacingOccurrences(
-                of: "\\s+$",
-                with: "",
-                options: .regularExpression
-            )
+        func flushParagraph() {
+            guard !currentParagraph.isEmpty else { return }
+            blocks.append(makeParagraph(currentParagraph))
+            currentParagraph = ""
+        }
 
-            if line.hasPrefix("### ") {
-                if !currentParagraph.isEmpty {
-                    blocks.append(makeParagraph(currentParagraph.joined(separator: "\n")))
-                    currentParagraph = []
-                }
-                blocks.append(.heading3(String(line.dropFirst(4))))
-            } else if line.hasPrefix("## ") {
-                if !currentParagraph.isEmpty {
-                    blocks.append(makeParagraph(currentParagraph.joined(separator: "\n")))
-                    currentParagraph = []
-                }
-                blocks.append(.heading2(String(line.dropFirst(3))))
-            } else if line.hasPrefix("# ") {
-                if !currentParagraph.isEmpty {
-                    blocks.append(makeParagraph(currentParagraph.joined(separator: "\n")))
-                    currentParagraph = []
-                }
-                blocks.append(.heading1(String(line.dropFirst(2))))
+        // Lines are found by scanning the UTF-8 bytes for LF rather than splitting
+        // on `Character`, which avoids grapheme breaking over the whole file and
+        // also splits CRLF ("\r\n" is a single `Character`). Only the slices that
+        // become block text are copied into new strings.
+        let bytes = content.utf8
+        let newlines = Self.newlineOffsets(in: content)
+        // Most notes are plain prose. With no '#' anywhere in the file no line
+        // can be a heading, so the per-line heading check is skipped entirely.
+        let mayContainHeadings = Self.contains(UInt8(ascii: "#"), in: content)
+        var lineStart = bytes.startIndex
+        for lineIndex in 0...newlines.count {
+            let lineEnd = lineIndex < newlines.count
+                ? bytes.index(bytes.startIndex, offsetBy: newlines[lineIndex])
+                : bytes.endIndex
+            let line = Self.trimmingTrailingWhitespace(content[lineStart..<lineEnd])
+
+            if mayContainHeadings, let heading = Self.heading(in: line) {
+                flushParagraph()
+                blocks.append(Self.headingFactories[heading.level - 1](heading.text))
             } else if line.isEmpty {
+                flushParagraph()
+            } else {
                 if !currentParagraph.isEmpty {
-                    blocks.append(makeParagraph(currentParagraph.joined(separator: "\n")))
-                    currentParagraph = []
+                    currentParagraph += "\n"
                 }
-            } else {
-                currentParagraph.append(line)
+                currentParagraph += line
             }
-        }
 
-        if !currentParagraph.isEmpty {
-            blocks.append(makeParagraph(currentParagraph.joined(separator: "\n")))
+            if lineEnd < bytes.endIndex {
+                lineStart = bytes.index(after: lineEnd)
+            }
         }
 
+        flushParagraph()
+
         return blocks
     }
 
     // MARK: - Private
 
+    /// Whether `byte` occurs anywhere in `content`'s UTF-8, checked with `memchr`.
+    private static func contains(_ byte: UInt8, in content: String) -> Bool {
+        let found = content.utf8.withContiguousStorageIfAvailable { buffer -> Bool in
+            guard let base = buffer.baseAddress else { return false }
+            return memchr(base, Int32(byte), buffer.count) != nil
+        }
+        return found ?? content.utf8.contains(byte)
+    }
+
+    /// UTF-8 offsets of every LF in `content`, located up front with `memchr`,
+    /// which scans the buffer a vector at a time instead of byte by byte.
+    private static func newlineOffsets(in content: String) -> [Int] {
+        let offsets = content.utf8.withContiguousStorageIfAvailable { buffer -> [Int] in
+            guard let base = buffer.baseAddress else { return [] }
+            var offsets: [Int] = []
+            var position = 0
+            while position < buffer.count,
+                  let match = memchr(base + position, 0x0A, buffer.count - position) {
+                let offset = UnsafeRawPointer(base).distance(to: UnsafeRawPointer(match))
+                offsets.append(offset)
+                position = offset + 1
+            }
+            return offsets
+        }
+        return offsets ?? content.utf8.enumerated().compactMap { $0.element == 0x0A ? $0.offset : nil }
+    }
+
+    /// Classifies an ATX heading line (`# `, `## `, `### `) with a single byte
+    /// scan of the leading `#` run, instead of testing each prefix in turn.
+    /// - Returns: The heading level and text, or `nil` if `line` is not a heading.
+    private static func heading(in line: Substring) -> (level: Int, text: String)? {
+        let bytes = line.utf8
+        let level = bytes.prefix(while: { $0 == UInt8(ascii: "#") }).count
+        guard level >= 1, level <= headingFactories.count else { return nil }
+        let rest = bytes.dropFirst(level)
+        guard rest.first == UInt8(ascii: " ") else { return nil }
+        return (level, String(line[rest.index(after: rest.startIndex)...]))
+    }
+
+    /// Drops trailing whitespace from `line` with a backwards scalar scan.
+    ///
+    /// Matches the ICU `\s` class (`[\t\n\f\r\p{Z}]`) that the parser used to
+    /// strip via a per-line regular expression, so `\r` from CRLF files and
+    /// full-width spaces (U+3000) are removed as before.
+    private static func trimmingTrailingWhitespace(_ line: Substring) -> Substring {
+        let scalars = line.unicodeScalars
+        var end = scalars.endIndex
+        while end > scalars.startIndex {
+            let previous = scalars.index(before: end)
+            guard isWhitespace(scalars[previous]) else { break }
+            end = previous
+        }
+        return line[..<end]
+    }
+
+    private static func isWhitespace(_ scalar: Unicode.Scalar) -> Bool {
+        switch scalar {
+        case "\t", "\n", "\u{0C}", "\r":
+            return true
+        default:
+            switch scalar.properties.generalCategory {
+            case .spaceSeparator, .lineSeparator, .paragraphSeparator:
+                return true
+            default:
+                return false
+            }
+        }
+    }
+
+    /// Notion's limit on the length of a single rich text `content` string.
+    private static let maxTextLength = 2000
+
+    /// Wraps `text` in a paragraph block, cutting it to ``maxTextLength``
+    /// characters (ending in "...") when it is longer.
+    ///
+    /// Walks at most ``maxTextLength`` characters instead of counting the
+    /// whole paragraph first.
     private func makeParagraph(_ text: String) -> NotionBlock {
-        let truncated = text.count > 2000 ? String(text.prefix(1997)) + "..." : text
-        return .paragraph(truncated)
+        let limit = Self.maxTextLength
+        guard
+            let end = text.index(text.startIndex, offsetBy: limit, limitedBy: text.endIndex),
+            end < text.endIndex
+        else {
+            return .paragraph(text)
+        }
+        let cut = text.index(end, offsetBy: -3)
+        return .paragraph(String(text[..<cut]) + "...")
     }
 }
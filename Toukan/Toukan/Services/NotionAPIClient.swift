@@ -37,6 +37,34 @@ extension NotionAPIError: LocalizedError {
     }
 }
 
+extension NotionAPIError {
+    /// Whether the same request may be sent again after a pause.
+    ///
+    /// Creating a page and appending blocks are not idempotent, so only failures
+    /// where Notion cannot have applied the request qualify: rate limiting,
+    /// 502/503 from the gateway, and connections that were never established.
+    /// A timeout or a dropped connection may hit after the request was processed,
+    /// and retrying it could create a duplicate page, so those are final too.
+    var isTransient: Bool {
+        switch self {
+        case .rateLimited:
+            return true
+        case .serverError(let statusCode):
+            return [502, 503].contains(statusCode)
+        case .networkError(let underlying):
+            guard let urlError = underlying as? URLError else { return false }
+            switch urlError.code {
+            case .cannotFindHost, .cannotConnectToHost, .dnsLookupFailed, .notConnectedToInternet:
+                return true
+            default:
+                return false
+            }
+        default:
+            return false
+        }
+    }
+}
+
 // MARK: - Block Types
 
 /// Represents a Notion block for the `children` array of a page creation request.
@@ -51,27 +79,10 @@ struct NotionBlock: Encodable, Sendable {
         case paragraph
     }
 
-    /// Shared content struct used inside every block's rich_text array.
-    struct RichText: Encodable, Sendable {
-        let type: String = "text"
-        let text: TextContent
-
-        struct TextContent: Encodable, Sendable {
-            let content: String
-        }
-    }
-
-    /// Payload carried by each block type (always a `rich_text` array).
-    struct BlockContent: Encodable, Sendable {
-        let richText: [RichText]
-
-        enum CodingKeys: String, CodingKey {
-            case richText = "rich_text"
-        }
-    }
-
-    // Single non-optional backing store for all block types.
-    private let content: BlockContent
+    /// Plain text of the block. The `rich_text` wrapper around it is the same
+    /// for every block type, so it is built at encode time rather than stored
+    /// per block.
+    private let text: String
 
     // MARK: Encoding
 
@@ -84,50 +95,66 @@ struct NotionBlock: Encodable, Sendable {
         case paragraph
     }
 
+    /// Keys of the per-type payload, `{"rich_text": [{"type": "text", "text": {"content": …}}]}`.
+    private enum ContentKeys: String, CodingKey {
+        case richText = "rich_text"
+    }
+
+    private enum RichTextKeys: String, CodingKey {
+        case type
+        case text
+    }
+
+    private enum TextKeys: String, CodingKey {
+        case content
+    }
+
     func encode(to encoder: Encoder) throws {
         var container = encoder.container(keyedBy: CodingKeys.self)
         try container.encode(object, forKey: .object)
         try container.encode(type.rawValue, forKey: .type)
 
+        let contentKey: CodingKeys
         switch type {
-        case .heading1:
-            try container.encode(content, forKey: .heading1)
-        case .heading2:
-            try container.encode(content, forKey: .heading2)
-        case .heading3:
-            try container.encode(content, forKey: .heading3)
-        case .paragraph:
-            try container.encode(content, forKey: .paragraph)
+        case .heading1: contentKey = .heading1
+        case .heading2: contentKey = .heading2
+        case .heading3: contentKey = .heading3
+        case .paragraph: contentKey = .paragraph
         }
+
+        // The payload is identical for every block type, so it is written
+        // straight into nested containers rather than built as values first.
+        var content = container.nestedContainer(keyedBy: ContentKeys.self, forKey: contentKey)
+        var richText = content.nestedUnkeyedContainer(forKey: .richText)
+        var item = richText.nestedContainer(keyedBy: RichTextKeys.self)
+        try item.encode("text", forKey: .type)
+        var textContent = item.nestedContainer(keyedBy: TextKeys.self, forKey: .text)
+        try textContent.encode(text, forKey: .content)
     }
 
     // MARK: Private init
 
-    private init(type: BlockType, content: BlockContent) {
+    private init(type: BlockType, text: String) {
         self.type = type
-        self.content = content
+        self.text = text
     }
 
     // MARK: Factory methods
 
-    private static func richText(for text: String) -> [RichText] {
-        [RichText(text: RichText.TextContent(content: text))]
-    }
-
     static func heading1(_ text: String) -> NotionBlock {
-        NotionBlock(type: .heading1, content: BlockContent(richText: richText(for: text)))
+        NotionBlock(type: .heading1, text: text)
     }
 
     static func heading2(_ text: String) -> NotionBlock {
-        NotionBlock(type: .heading2, content: BlockContent(richText: richText(for: text)))
+        NotionBlock(type: .heading2, text: text)
     }
 
     static func heading3(_ text: String) -> NotionBlock {
-        NotionBlock(type: .heading3, content: BlockContent(richText: richText(for: text)))
+        NotionBlock(type: .heading3, text: text)
     }
 
     static func paragraph(_ text: String) -> NotionBlock {
-        NotionBlock(type: .paragraph, content: BlockContent(richText: richText(for: text)))
+        NotionBlock(type: .paragraph, text: text)
     }
 }
 
@@ -282,24 +309,84 @@ private struct NotionErrorResponse: Decodable, Sendable {
 
 struct NotionAPIClient: Sendable {
 
+    // MARK: Retry Policy
+
+    /// Controls how transient failures (see ``NotionAPIError/isTransient``) are retried.
+    struct RetryPolicy: Sendable {
+        /// Total number of attempts, including the first request.
+        var maxAttempts: Int
+        /// Backoff before the first retry; doubled for each further retry.
+        var baseDelay: TimeInterval
+        /// Upper bound for a single computed backoff.
+        var maxDelay: TimeInterval
+
+        /// Up to 5 attempts with 1 s, 2 s, 4 s, 8 s backoff (jittered, capped at 30 s).
+        static let `default` = RetryPolicy(maxAttempts: 5, baseDelay: 1, maxDelay: 30)
+
+        /// Fail on the first error.
+        static let none = RetryPolicy(maxAttempts: 1, baseDelay: 0, maxDelay: 0)
+
+        /// Delay before the retry that follows `attempt` (1-based).
+        /// A server-supplied `Retry-After` takes precedence over the computed backoff.
+        func delay(afterAttempt attempt: Int, retryAfter: Int?) -> TimeInterval {
+            if let retryAfter {
+                return TimeInterval(retryAfter)
+            }
+            let exponential = baseDelay * pow(2, Double(attempt - 1))
+            return min(exponential, maxDelay) * Double.random(in: 0.5...1)
+        }
+    }
+
     // MARK: Private state
 
     private let token: String
     private let session: URLSession
+    private let retryPolicy: RetryPolicy
+    private let rateLimiter: RateLimiter?
 
     private static let logger = Logger(
         subsystem: "com.clevique.Toukan",
         category: "NotionAPI"
     )
 
+    /// Shared coders. Neither is configured per request, so one instance each
+    /// avoids re-creating them (and their caches) for every call.
+    private static let encoder = JSONEncoder()
+    private static let decoder = JSONDecoder()
+
     private static let baseURL = URL(string: "https://api.notion.com/v1")!
+    /// Notion's cap on `children` in a single create or append request.
+    static let maxBlocksPerRequest = 100
     private static let notionVersion = "2025-09-03"
 
+    /// Session shared by every client so uploads reuse the same pooled
+    /// HTTP/2 connection to api.notion.com instead of setting up TLS again.
+    /// Responses are never cached and no cookies are stored.
+    static let sharedSession: URLSession = {
+        let configuration = URLSessionConfiguration.default
+        configuration.urlCache = nil
+        configuration.requestCachePolicy = .reloadIgnoringLocalCacheData
+        configuration.httpCookieStorage = nil
+        configuration.httpShouldSetCookies = false
+        configuration.httpMaximumConnectionsPerHost = 10
+        configuration.timeoutIntervalForRequest = 30
+        return URLSession(configuration: configuration)
+    }()
+
     // MARK: Init
 
-    init(token: String, session: URLSession = .shared) {
+    /// - Parameter rateLimiter: Paces every attempt, retries included. Pass `nil`
+    ///   to send requests unthrottled (e.g. against a mock session in tests).
+    init(
+        token: String,
+        session: URLSession = NotionAPIClient.sharedSession,
+        retryPolicy: RetryPolicy = .default,
+        rateLimiter: RateLimiter? = RateLimiter.notion
+    ) {
         self.token = token
         self.session = session
+        self.retryPolicy = retryPolicy
+        self.rateLimiter = rateLimiter
     }
 
     // MARK: - Public API
@@ -340,7 +427,7 @@ struct NotionAPIClient: Sendable {
         let body = CreatePageRequest(
             parent: .init(dataSourceId: dataSourceId),
             properties: properties,
-            children: Array(blocks.prefix(100))
+            children: Array(blocks.prefix(Self.maxBlocksPerRequest))
         )
 
         var request = URLRequest(url: url)
@@ -348,35 +435,35 @@ struct NotionAPIClient: Sendable {
         applyHeaders(to: &request)
 
         do {
-            request.httpBody = try JSONEncoder().encode(body)
+            request.httpBody = try Self.encoder.encode(body)
         } catch {
             Self.logger.error("createPage: failed to encode request body — \(error, privacy: .public)")
             throw NotionAPIError.networkError(underlying: error)
         }
 
-        Self.logger.info("createPage: POST \(url.absoluteString, privacy: .public) title='\(title, privacy: .public)'")
+        Self.logger.debug("createPage: POST \(url.absoluteString, privacy: .public) title='\(title, privacy: .public)'")
 
         let (data, _) = try await performRequest(request)
 
         let page: NotionPage
         do {
-            page = try JSONDecoder().decode(NotionPage.self, from: data)
+            page = try Self.decoder.decode(NotionPage.self, from: data)
         } catch {
             Self.logger.error("createPage: decoding failed — \(error, privacy: .public)")
             throw NotionAPIError.decodingError(underlying: error)
         }
-        Self.logger.info("createPage: created page id=\(page.id, privacy: .public)")
-
-        // Append remaining blocks in chunks of 100
-        if blocks.count > 100 {
-            var offset = 100
-            while offset < blocks.count {
-                let end = min(offset + 100, blocks.count)
-                let chunk = Array(blocks[offset..<end])
-                try await appendBlocks(pageId: page.id, blocks: chunk)
-                offset = end
+        Self.logger.debug("createPage: created page id=\(page.id, privacy: .public)")
+
+        // Append remaining blocks in chunks of maxBlocksPerRequest, one request each
+        let limit = Self.maxBlocksPerRequest
+        if blocks.count > limit {
+            var batches = 0
+            for offset in stride(from: limit, to: blocks.count, by: limit) {
+                let end = min(offset + limit, blocks.count)
+                try await appendBlocks(pageId: page.id, blocks: Array(blocks[offset..<end]))
+                batches += 1
             }
-            Self.logger.info("createPage: appended \(blocks.count - 100) additional blocks in \((blocks.count - 101) / 100 + 1) batch(es)")
+            Self.logger.debug("createPage: appended \(blocks.count - limit) additional blocks in \(batches) batch(es)")
         }
 
         return page
@@ -399,15 +486,15 @@ struct NotionAPIClient: Sendable {
         applyHeaders(to: &request)
 
         do {
-            request.httpBody = try JSONEncoder().encode(AppendRequest(children: blocks))
+            request.httpBody = try Self.encoder.encode(AppendRequest(children: blocks))
         } catch {
             Self.logger.error("appendBlocks: failed to encode — \(error, privacy: .public)")
             throw NotionAPIError.networkError(underlying: error)
         }
 
-        Self.logger.info("appendBlocks: PATCH \(url.absoluteString, privacy: .public) (\(blocks.count) blocks)")
+        Self.logger.debug("appendBlocks: PATCH \(url.absoluteString, privacy: .public) (\(blocks.count) blocks)")
         _ = try await performRequest(request)
-        Self.logger.info("appendBlocks: success (\(blocks.count) blocks)")
+        Self.logger.debug("appendBlocks: success (\(blocks.count) blocks)")
     }
 
     /// Retrieves database info including data sources by calling `GET /databases/{database_id}`.
@@ -421,12 +508,12 @@ struct NotionAPIClient: Sendable {
         request.httpMethod = "GET"
         applyHeaders(to: &request)
 
-        Self.logger.info("fetchDatabase: GET \(url.absoluteString, privacy: .public)")
+        Self.logger.debug("fetchDatabase: GET \(url.absoluteString, privacy: .public)")
 
         let (data, _) = try await performRequest(request)
 
         do {
-            let response = try JSONDecoder().decode(DatabaseResponse.self, from: data)
+            let response = try Self.decoder.decode(DatabaseResponse.self, from: data)
             Self.logger.info("fetchDatabase: '\(response.databaseName, privacy: .public)' with \(response.dataSources.count, privacy: .public) data source(s)")
             return response
         } catch {
@@ -464,12 +551,12 @@ struct NotionAPIClient: Sendable {
         request.httpMethod = "GET"
         applyHeaders(to: &request)
 
-        Self.logger.info("fetchDataSource: GET \(url.absoluteString, privacy: .public)")
+        Self.logger.debug("fetchDataSource: GET \(url.absoluteString, privacy: .public)")
 
         let (data, _) = try await performRequest(request)
 
         do {
-            let response = try JSONDecoder().decode(DataSourceResponse.self, from: data)
+            let response = try Self.decoder.decode(DataSourceResponse.self, from: data)
             Self.logger.info("fetchDataSource: '\(response.name, privacy: .public)'")
             return response
         } catch {
@@ -482,8 +569,7 @@ struct NotionAPIClient: Sendable {
 
     /// Validates that the given string is a well-formed UUID (8-4-4-4-12 hex).
     private static func validateUUID(_ value: String, label: String) throws {
-        let pattern = #"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"#
-        guard value.range(of: pattern, options: .regularExpression) != nil else {
+        guard NotionURLParser.isDashedUUID(value) else {
             throw NotionAPIError.validationError(message: "Invalid \(label): '\(value)' is not a valid UUID")
         }
     }
@@ -496,9 +582,33 @@ struct NotionAPIClient: Sendable {
         request.setValue("application/json", forHTTPHeaderField: "Accept")
     }
 
-    /// Executes the request and maps HTTP status codes to `NotionAPIError`.
+    /// Executes the request, retrying transient failures according to `retryPolicy`.
     private func performRequest(
         _ request: URLRequest
+    ) async throws -> (Data, HTTPURLResponse) {
+        var attempt = 1
+        while true {
+            try await rateLimiter?.acquire()
+            do {
+                return try await performRequestOnce(request)
+            } catch let error as NotionAPIError where error.isTransient && attempt < retryPolicy.maxAttempts {
+                let retryAfter: Int?
+                if case .rateLimited(let value) = error {
+                    retryAfter = value
+                } else {
+                    retryAfter = nil
+                }
+                let delay = retryPolicy.delay(afterAttempt: attempt, retryAfter: retryAfter)
+                Self.logger.warning("performRequest: \(error.localizedDescription, privacy: .public) — retry \(attempt, privacy: .public)/\(retryPolicy.maxAttempts - 1, privacy: .public) in \(delay, format: .fixed(precision: 1), privacy: .public)s")
+                try await Task.sleep(for: .seconds(delay))
+                attempt += 1
+            }
+        }
+    }
+
+    /// Executes the request once and maps HTTP status codes to `NotionAPIError`.
+    private func performRequestOnce(
+        _ request: URLRequest
     ) async throws -> (Data, HTTPURLResponse) {
         let data: Data
         let urlResponse: URLResponse
@@ -551,6 +661,6 @@ struct NotionAPIClient: Sendable {
 
     /// Attempts to decode a human-readable error message from the Notion error response body.
     private func decodedErrorMessage(from data: Data) -> String? {
-        try? JSONDecoder().decode(NotionErrorResponse.self, from: data).message
+        try? Self.decoder.decode(NotionErrorResponse.self, from: data).message
     }
 }
@@ -5,6 +5,25 @@ import Foundation
 /// Stateless utility — all methods are static.
 struct NotionURLParser: Sendable {
 
+    // MARK: Patterns
+
+    // Compiled once and shared; `String.range(of:options: .regularExpression)`
+    // would compile the pattern again on every call.
+    private static let dashedUUID = try! NSRegularExpression(
+        pattern: #"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"#,
+        options: .caseInsensitive
+    )
+    private static let undashedUUID = try! NSRegularExpression(
+        pattern: #"^[0-9a-f]{32}$"#,
+        options: .caseInsensitive
+    )
+    /// The greedy `.*` backtracks from the end, so the capture is the last
+    /// 32-hex run in the string (what a backwards search would find).
+    private static let lastHexID = try! NSRegularExpression(
+        pattern: #".*([0-9a-f]{32})"#,
+        options: .caseInsensitive
+    )
+
     /// Extracts a Notion database ID (UUID) from a share link or raw ID string.
     ///
     /// Accepted inputs:
@@ -17,13 +36,12 @@ struct NotionURLParser: Sendable {
     ///   the input cannot be parsed.
     static func extractDatabaseId(from input: String) -> String? {
         // Already a UUID with dashes
-        if input.range(of: #"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"#,
-                       options: [.regularExpression, .caseInsensitive]) != nil {
+        if isDashedUUID(input) {
             return input.lowercased()
         }
 
         // 32 hex chars without dashes
-        if input.range(of: #"^[0-9a-f]{32}$"#, options: [.regularExpression, .caseInsensitive]) != nil {
+        if matches(undashedUUID, input) {
             return formatAsUUID(input.lowercased())
         }
 
@@ -34,13 +52,24 @@ struct NotionURLParser: Sendable {
             return nil
         }
         let lastComponent = url.lastPathComponent
-        guard let match = lastComponent.range(
-            of: #"[0-9a-f]{32}"#,
-            options: [.regularExpression, .caseInsensitive, .backwards]
-        ) else {
+        guard let match = lastHexID.firstMatch(
+            in: lastComponent,
+            range: NSRange(lastComponent.startIndex..., in: lastComponent)
+        ),
+            let idRange = Range(match.range(at: 1), in: lastComponent) else {
             return nil
         }
-        return formatAsUUID(String(lastComponent[match]).lowercased())
+        return formatAsUUID(String(lastComponent[idRange]).lowercased())
+    }
+
+    /// Returns `true` when `value` is a UUID in 8-4-4-4-12 form, in either case.
+    static func isDashedUUID(_ value: String) -> Bool {
+        matches(dashedUUID, value)
+    }
+
+    /// Returns `true` when `regex` matches somewhere in `input`.
+    private static func matches(_ regex: NSRegularExpression, _ input: String) -> Bool {
+        regex.firstMatch(in: input, range: NSRange(input.startIndex..., in: input)) != nil
     }
 
     /// Returns `true` when `host` is a known Notion domain.
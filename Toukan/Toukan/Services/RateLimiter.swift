@@ -0,0 +1,76 @@
+import Foundation
+
+// MARK: - TokenBucket
+
+/// Token-bucket arithmetic behind ``RateLimiter``, kept free of clocks and
+/// sleeping so it can be tested with explicit timestamps.
+///
+/// The bucket holds up to `capacity` tokens and refills at `rate` tokens per
+/// second. Each request takes one token. When the bucket is empty the balance
+/// goes negative, so callers that arrive together queue up one `1 / rate`
+/// interval apart rather than all waking at the same moment.
+struct TokenBucket: Sendable {
+
+    /// Tokens added per second.
+    let rate: Double
+    /// Maximum number of tokens, i.e. the largest burst allowed without waiting.
+    let capacity: Double
+
+    private var tokens: Double
+    private var lastUpdate: TimeInterval?
+
+    /// - Parameters:
+    ///   - rate:     Sustained requests per second. Must be > 0.
+    ///   - capacity: Burst size. Must be ≥ 1. The bucket starts full.
+    init(rate: Double, capacity: Double) {
+        precondition(rate > 0, "TokenBucket rate must be positive")
+        precondition(capacity >= 1, "TokenBucket capacity must be at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+    }
+
+    /// Takes one token at time `now` (seconds on any monotonic clock).
+    /// - Returns: How long the caller must wait before its request may go out;
+    ///   `0` if a token was available.
+    mutating func reserve(at now: TimeInterval) -> TimeInterval {
+        if let lastUpdate {
+            tokens = min(capacity, tokens + max(0, now - lastUpdate) * rate)
+        }
+        lastUpdate = now
+        tokens -= 1
+        return tokens >= 0 ? 0 : -tokens / rate
+    }
+}
+
+// MARK: - RateLimiter
+
+/// Client-side rate limit for outgoing Notion API requests.
+///
+/// Notion allows an average of three requests per second per integration and
+/// answers bursts above that with `429 rate_limited`. Pacing requests here
+/// keeps a burst of uploads under the limit instead of relying on retries.
+actor RateLimiter {
+
+    /// Shared by every ``NotionAPIClient`` by default, since they all use the
+    /// same integration token.
+    static let notion = RateLimiter(requestsPerSecond: 3, burst: 3)
+
+    private var bucket: TokenBucket
+
+    /// - Parameters:
+    ///   - requestsPerSecond: Sustained request rate.
+    ///   - burst:             Requests allowed back to back before pacing starts.
+    init(requestsPerSecond: Double, burst: Int) {
+        self.bucket = TokenBucket(rate: requestsPerSecond, capacity: Double(burst))
+    }
+
+    /// Suspends until the caller may send its next request.
+    /// - Throws: `CancellationError` if the task is cancelled while waiting.
+    func acquire() async throws {
+        let wait = bucket.reserve(at: ProcessInfo.processInfo.systemUptime)
+        if wait > 0 {
+            try await Task.sleep(for: .seconds(wait))
+        }
+    }
+}
@@ -1,3 +1,4 @@
+import CryptoKit
 import Foundation
 import os
 import Observation
@@ -34,21 +35,39 @@ final class SyncEngine {
     // MARK: - Private State
 
     private let parser = MarkdownParser()
+    /// Bounds the number of page uploads in flight. Each ``processFile(_:noteId:archiveDirectory:)``
+    /// runs in its own task, so a burst of new files would otherwise hit the Notion API all at once.
+    private let uploadSlots = AsyncSemaphore(limit: SyncEngine.maxConcurrentUploads)
     private var watcher: DirectoryWatcher?
     private var apiClient: NotionAPIClient?
     /// Cached title property name from the data source schema.
     private var cachedTitlePropertyName: String?
+    /// In-flight title property lookup shared by files that arrive before it is cached.
+    private var titlePropertyTask: Task<String, Error>?
     /// Security-scoped resource URLs that have been started and must be stopped on shutdown.
     private var accessedURLs: [URL] = []
+    /// Watched targets keyed by the symlink-resolved directory path that
+    /// ``DirectoryWatcher`` reports back, built once in ``start()``.
+    private var targetsByDirectory: [String: WatchedTarget] = [:]
 
     private let logger = Logger(subsystem: "com.clevique.Toukan", category: "SyncEngine")
 
+    /// Maximum number of concurrent `createPage` uploads.
+    private static let maxConcurrentUploads = 5
+
     var activeTargetCount: Int {
         accessedURLs.count
     }
 
     private var strings: Strings { languageManager.strings }
 
+    /// What ``handleNewFile(_:in:)`` needs for a watched directory, resolved once
+    /// in ``start()`` so a new-file event does only a dictionary lookup.
+    private struct WatchedTarget {
+        let noteId: String?
+        let archiveDirectory: URL
+    }
+
     // MARK: - Init
 
     init(bookmarkManager: BookmarkManager, apiSettings: APISettings, logStore: SyncLogStore, languageManager: LanguageManager) {
@@ -69,19 +88,23 @@ final class SyncEngine {
         }
     }
 
+    /// Logs `message` as an error and shows it as the current ``errorMessage``.
+    private func reportError(_ message: String) {
+        log(.error, message)
+        errorMessage = message
+    }
+
     // MARK: - Lifecycle
 
     /// Validates configuration, creates the API client and directory watcher, and
     /// begins monitoring all registered sync targets.
     func start() {
         guard !apiSettings.token.isEmpty else {
-            errorMessage = strings.tokenNotConfigured
-            log(.error, strings.tokenNotConfigured)
+            reportError(strings.tokenNotConfigured)
             return
         }
         guard !apiSettings.dataSourceId.isEmpty else {
-            errorMessage = strings.dataSourceIdNotConfigured
-            log(.error, strings.dataSourceIdNotConfigured)
+            reportError(strings.dataSourceIdNotConfigured)
             return
         }
 
@@ -99,6 +122,7 @@ final class SyncEngine {
 
         // Start accessing every registered sync target via security-scoped bookmarks.
         var startedURLs: [URL] = []
+        var watchedTargets: [String: WatchedTarget] = [:]
         for target in bookmarkManager.targets {
             guard let url = bookmarkManager.startAccessing(target) else {
                 log(.warning, strings.targetAccessFailed(name: target.displayName))
@@ -108,6 +132,15 @@ final class SyncEngine {
                 try newWatcher.watch(url)
                 newWatcher.scanExistingFiles(in: url)
                 startedURLs.append(url)
+                let directoryURL = url.resolvingSymlinksInPath()
+                let archiveDirectory = directoryURL.appendingPathComponent(target.archiveDirName, isDirectory: true)
+                // Create the archive folder up front so archiving a file is a
+                // single rename. FileArchiver recreates it if this fails.
+                try? FileArchiver.prepare(archiveDirectory)
+                watchedTargets[directoryURL.path] = WatchedTarget(
+                    noteId: target.noteId,
+                    archiveDirectory: archiveDirectory
+                )
                 log(.info, strings.targetWatching(path: url.path))
             } catch {
                 log(.error, strings.targetWatchFailed(name: url.path))
@@ -116,14 +149,14 @@ final class SyncEngine {
         }
 
         accessedURLs = startedURLs
+        targetsByDirectory = watchedTargets
 
         if startedURLs.isEmpty {
             if bookmarkManager.targets.isEmpty {
                 log(.warning, strings.noTargetsConfigured)
                 errorMessage = strings.noTargetsConfigured
             } else {
-                log(.error, strings.allTargetsFailed)
-                errorMessage = strings.allTargetsFailed
+                reportError(strings.allTargetsFailed)
             }
             isRunning = false
         } else {
@@ -145,16 +178,20 @@ final class SyncEngine {
         log(.info, strings.syncStopping)
 
         processingFiles.removeAll()
+        runGeneration += 1
 
         watcher?.stopAll()
         watcher = nil
         apiClient = nil
         cachedTitlePropertyName = nil
+        titlePropertyTask?.cancel()
+        titlePropertyTask = nil
 
         for url in accessedURLs {
             bookmarkManager.stopAccessing(url)
         }
         accessedURLs = []
+        targetsByDirectory = [:]
 
         isRunning = false
         log(.info, strings.syncStopped)
@@ -170,10 +207,7 @@ final class SyncEngine {
     nonisolated private func handleNewFile(_ fileURL: URL, in directoryURL: URL) {
         Task { @MainActor [weak self] in
             guard let self else { return }
-            let target = bookmarkManager.targets.first { target in
-                bookmarkManager.resolveURL(for: target)?.standardizedFileURL
-                    == directoryURL.standardizedFileURL
-            }
+            let target = targetsByDirectory[directoryURL.path]
             if target == nil {
                 self.log(.warning, "handleNewFile: no matching target for '\(directoryURL.path)' — using default archive dir")
             }
@@ -181,23 +215,45 @@ final class SyncEngine {
             await processFile(
                 fileURL,
                 noteId: target?.noteId,
-                archiveDirName: target?.archiveDirName ?? "archived"
+                archiveDirectory: target?.archiveDirectory
+                    ?? directoryURL.appendingPathComponent("archived", isDirectory: true)
             )
         }
     }
 
     // MARK: - File Processing
 
+    /// Files currently being processed — prevents duplicate processing from
+    /// concurrent scan + watcher events.
+    private var processingFiles: Set<String> = []
+
+    /// Incremented by ``stop()``. A file queued for an upload slot in an earlier
+    /// run sees a different value once it gets the slot and gives up, so it
+    /// cannot race the next run's scan of the same file.
+    private var runGeneration = 0
+
+    /// SHA-256 of files that were uploaded but could not be archived. Kept
+    /// across stop/start, since a restart is what rescans them. Usually empty,
+    /// so files are hashed only when an entry exists for their path.
+    private var uploadLedger = UploadLedger()
+
+    /// Result of ``readAndUpload(_:noteId:canonicalPath:)``.
+    private enum UploadOutcome {
+        /// A new page was created from `content`, the file's bytes as read.
+        case uploaded(content: Data)
+        /// The file was uploaded earlier and is unchanged; only the archive is pending.
+        case alreadyUploaded
+        /// Reading or uploading failed; the error has been reported.
+        case failed
+    }
+
     /// Reads, parses, uploads, and archives a single Markdown file.
     ///
     /// - Parameters:
     ///   - fileURL: Path to the `.md` file to process.
     ///   - noteId:  Optional Notion page ID to attach as a "Lit Notes" relation.
-    /// Files currently being processed — prevents duplicate processing from
-    /// concurrent scan + watcher events.
-    private var processingFiles: Set<String> = []
-
-    private func processFile(_ fileURL: URL, noteId: String?, archiveDirName: String) async {
+    ///   - archiveDirectory: Folder the file is moved into once it has been uploaded.
+    private func processFile(_ fileURL: URL, noteId: String?, archiveDirectory archivedDir: URL) async {
         let filename = fileURL.lastPathComponent
         let canonicalPath = fileURL.resolvingSymlinksInPath().path
 
@@ -207,50 +263,104 @@ final class SyncEngine {
             return
         }
         processingFiles.insert(canonicalPath)
-        defer { processingFiles.remove(canonicalPath) }
+        let generation = runGeneration
+        defer {
+            // After a stop/start the entry belongs to the new run's task.
+            if generation == runGeneration {
+                processingFiles.remove(canonicalPath)
+            }
+        }
 
         log(.info, strings.processingFile(name: filename))
 
-        // 1. Read file content
-        let content: String
+        // Steps 1–3 hold an upload slot, so during a burst files are read,
+        // parsed and kept in memory only as fast as they can be uploaded.
+        await uploadSlots.wait()
+        guard isRunning, generation == runGeneration else {
+            await uploadSlots.signal()
+            logger.debug("processFile: sync stopped while '\(filename, privacy: .public)' was queued")
+            return
+        }
+        let outcome = await readAndUpload(fileURL, noteId: noteId, canonicalPath: canonicalPath)
+        await uploadSlots.signal()
+
+        let uploadedContent: Data?
+        switch outcome {
+        case .failed:
+            return
+        case .alreadyUploaded:
+            uploadedContent = nil
+        case .uploaded(let content):
+            uploadedContent = content
+        }
+
+        // 4. Archive the processed file
         do {
-            content = try String(contentsOf: fileURL, encoding: .utf8)
+            try FileArchiver.archive(fileURL, into: archivedDir)
+            uploadLedger.recordArchive(at: canonicalPath)
+            log(.info, strings.archiveSuccess(name: filename))
         } catch {
-            let message = strings.fileReadFailed(name: filename)
-            log(.error, message)
-            errorMessage = message
+            // Remember what was uploaded so the next scan archives the file
+            // instead of creating a second page.
+            if let uploadedContent {
+                uploadLedger.recordUpload(Self.digest(of: uploadedContent), at: canonicalPath)
+            }
+            reportError(strings.archiveFailed(name: filename))
             return
         }
 
+        // The page was counted when it was first uploaded.
+        guard uploadedContent != nil else {
+            errorMessage = nil
+            return
+        }
+
+        // 5. Update observable state on success
+        lastSyncedFile = filename
+        lastSyncedDate = Date()
+        syncedCount += 1
+        errorMessage = nil
+        log(.info, strings.syncComplete(name: filename, count: syncedCount))
+    }
+
+    /// Steps 1–3 of ``processFile(_:noteId:archiveDirectory:)``: read, parse and upload.
+    /// - Returns: Whether a page was created, already existed for this content,
+    ///   or could not be created. Failures are logged and surfaced through `errorMessage`.
+    private func readAndUpload(_ fileURL: URL, noteId: String?, canonicalPath: String) async -> UploadOutcome {
+        let filename = fileURL.lastPathComponent
+
+        // 1. Read file content and parse Markdown into Notion blocks. Both run
+        //    off the main actor so a large file does not stall the UI.
+        guard let content = await Self.readContent(of: fileURL) else {
+            reportError(strings.fileReadFailed(name: filename))
+            return .failed
+        }
+        // Hashing is only needed for the rare file whose archive failed earlier.
+        if uploadLedger.hasEntry(at: canonicalPath),
+           uploadLedger.isUploaded(Self.digest(of: content.data), at: canonicalPath) {
+            log(.info, strings.alreadyUploaded(name: filename))
+            return .alreadyUploaded
+        }
+        let blocks = await Self.parseBlocks(content.text, using: parser)
+
         // 2. Derive title from filename (strip extension)
         let title = fileURL.deletingPathExtension().lastPathComponent
 
-        // 3. Parse Markdown into Notion blocks
-        let blocks = parser.parse(content)
-
-        // 4. Upload to Notion
+        // 3. Upload to Notion
         guard let client = apiClient else {
-            let message = strings.apiClientNotReady
-            log(.error, message)
-            errorMessage = message
-            return
+            reportError(strings.apiClientNotReady)
+            return .failed
         }
 
         // Fetch and cache the title property name from the data source schema
         let titlePropertyName: String
-        if let cached = cachedTitlePropertyName {
-            titlePropertyName = cached
-        } else {
-            do {
-                titlePropertyName = try await client.fetchTitlePropertyName(dataSourceId: apiSettings.dataSourceId)
-                cachedTitlePropertyName = titlePropertyName
-                log(.info, "Title property: '\(titlePropertyName)'")
-            } catch {
-                let detail = (error as? LocalizedError)?.errorDescription ?? error.localizedDescription
-                log(.error, strings.uploadFailedDetail(name: filename, detail: detail))
-                errorMessage = strings.uploadFailed(name: filename)
-                return
-            }
+        do {
+            titlePropertyName = try await self.titlePropertyName(using: client)
+        } catch {
+            let detail = (error as? LocalizedError)?.errorDescription ?? error.localizedDescription
+            log(.error, strings.uploadFailedDetail(name: filename, detail: detail))
+            errorMessage = strings.uploadFailed(name: filename)
+            return .failed
         }
 
         do {
@@ -262,50 +372,74 @@ final class SyncEngine {
                 blocks: blocks
             )
             log(.info, strings.uploadSuccess(name: filename))
+            return .uploaded(content: content.data)
         } catch {
             let detail = (error as? LocalizedError)?.errorDescription ?? error.localizedDescription
             log(.error, strings.uploadFailedDetail(name: filename, detail: detail))
             errorMessage = strings.uploadFailed(name: filename)
-            return
+            return .failed
         }
+    }
 
-        // 5. Archive the processed file
-        let directoryURL = fileURL.deletingLastPathComponent()
-        let archivedDir = directoryURL.appendingPathComponent(archiveDirName, isDirectory: true)
-
-        do {
-            try FileManager.default.createDirectory(
-                at: archivedDir,
-                withIntermediateDirectories: true,
-                attributes: nil
-            )
-        } catch {
-            let message = strings.archiveFailed(name: filename)
-            log(.error, message)
-            errorMessage = message
-            return
+    /// Returns the data source's title property name, fetching it at most once.
+    ///
+    /// When a burst of files arrives before the name is cached, every file
+    /// awaits the same in-flight request instead of issuing its own.
+    private func titlePropertyName(using client: NotionAPIClient) async throws -> String {
+        if let cached = cachedTitlePropertyName {
+            return cached
+        }
+        if let pending = titlePropertyTask {
+            return try await pending.value
         }
 
-        let destination = archivedDir.appendingPathComponent(filename)
-        do {
-            // If a file with the same name already exists in the archive, remove it first
-            if FileManager.default.fileExists(atPath: destination.path) {
-                try FileManager.default.removeItem(at: destination)
+        let dataSourceId = apiSettings.dataSourceId
+        let task = Task { try await client.fetchTitlePropertyName(dataSourceId: dataSourceId) }
+        titlePropertyTask = task
+        let result = await task.result
+
+        // Ignore the result if stop() discarded this fetch while it was in flight.
+        if titlePropertyTask == task {
+            titlePropertyTask = nil
+            if case .success(let name) = result {
+                cachedTitlePropertyName = name
+                log(.info, "Title property: '\(name)'")
             }
-            try FileManager.default.moveItem(at: fileURL, to: destination)
-            log(.info, strings.archiveSuccess(name: filename))
-        } catch {
-            let message = strings.archiveFailed(name: filename)
-            log(.error, message)
-            errorMessage = message
-            return
         }
+        return try result.get()
+    }
 
-        // 6. Update observable state on success
-        lastSyncedFile = filename
-        lastSyncedDate = Date()
-        syncedCount += 1
-        errorMessage = nil
-        log(.info, strings.syncComplete(name: filename, count: syncedCount))
+    /// Reads `fileURL` as UTF-8 on a background task.
+    ///
+    /// The bytes are read once and decoded. They are kept until the file is
+    /// archived so ``uploadLedger`` can be given their digest if archiving
+    /// fails. The read bypasses the file cache (`.uncached`): each note is read
+    /// exactly once and then archived, so caching it would only evict data
+    /// that is actually reused.
+    ///
+    /// - Returns: The file's text and raw bytes, or `nil` if the file could not
+    ///   be read or is not valid UTF-8.
+    nonisolated private static func readContent(of fileURL: URL) async -> (text: String, data: Data)? {
+        await Task.detached(priority: .utility) { () -> (text: String, data: Data)? in
+            guard
+                let data = try? Data(contentsOf: fileURL, options: .uncached),
+                let text = String(data: data, encoding: .utf8)
+            else {
+                return nil
+            }
+            return (text, data)
+        }.value
+    }
+
+    /// SHA-256 of a file's bytes, as recorded in ``uploadLedger``.
+    nonisolated private static func digest(of data: Data) -> Data {
+        Data(SHA256.hash(data: data))
+    }
+
+    /// Parses `text` into Notion blocks on a background task.
+    nonisolated private static func parseBlocks(_ text: String, using parser: MarkdownParser) async -> [NotionBlock] {
+        await Task.detached(priority: .utility) {
+            parser.parse(text)
+        }.value
     }
 }
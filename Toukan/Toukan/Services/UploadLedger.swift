@@ -0,0 +1,37 @@
+import Foundation
+
+// MARK: - UploadLedger
+
+/// Remembers notes that were uploaded to Notion but could not be archived yet.
+///
+/// Such a note stays in the watched folder and is picked up again by the next
+/// scan. If its content still matches what was uploaded, ``SyncEngine`` only
+/// retries the archive instead of creating a second page.
+///
+/// Entries are keyed by the note's canonical (symlink-resolved) path and hold
+/// a digest of the uploaded bytes, so an edited note is uploaded again.
+struct UploadLedger: Sendable {
+
+    private var digests: [String: Data] = [:]
+
+    /// Whether an upload from `path` is still waiting to be archived. Lets
+    /// callers skip computing a digest in the common case.
+    func hasEntry(at path: String) -> Bool {
+        digests[path] != nil
+    }
+
+    /// Whether `digest` matches the content last uploaded from `path`.
+    func isUploaded(_ digest: Data, at path: String) -> Bool {
+        digests[path] == digest
+    }
+
+    /// Records that the content with `digest` was uploaded from `path`.
+    mutating func recordUpload(_ digest: Data, at path: String) {
+        digests[path] = digest
+    }
+
+    /// Forgets `path` once the note has been archived.
+    mutating func recordArchive(at path: String) {
+        digests[path] = nil
+    }
+}
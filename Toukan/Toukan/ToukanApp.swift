@@ -8,9 +8,15 @@ struct ToukanApp: App {
     @State private var logStore: SyncLogStore
     private let bookmarkManager: BookmarkManager
 
+    /// `true` when the app is only launched as the host of the unit-test bundle.
+    /// The tests never use the app's own state, so launch then skips reading
+    /// the Keychain (which can prompt on CI) and the stored sync targets.
+    private static let isHostingTests =
+        ProcessInfo.processInfo.environment["XCTestConfigurationFilePath"] != nil
+
     init() {
-        let bm = BookmarkManager()
-        let api = APISettings()
+        let bm = BookmarkManager(loadStoredTargets: !Self.isHostingTests)
+        let api = APISettings(loadStoredValues: !Self.isHostingTests)
         let ls = SyncLogStore()
         let lm = LanguageManager()
         let eng = SyncEngine(bookmarkManager: bm, apiSettings: api, logStore: ls, languageManager: lm)
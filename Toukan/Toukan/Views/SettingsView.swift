@@ -49,7 +49,10 @@ final class APISettings {
 
     // MARK: Init
 
-    init() {
+    /// - Parameter loadStoredValues: Pass `false` to start empty without touching
+    ///   the Keychain or UserDefaults. Edits are then not persisted either.
+    init(loadStoredValues: Bool = true) {
+        guard loadStoredValues else { return }
         migrateFromUserDefaultsIfNeeded()
         token = KeychainManager.load(key: Self.tokenKey) ?? ""
         dataSourceId = UserDefaults.standard.string(forKey: Self.dataSourceIdKey) ?? ""
@@ -0,0 +1,131 @@
+import XCTest
+@testable import Toukan
+
+final class DirectoryWatcherTests: XCTestCase {
+
+    /// Collects the files passed to the handler, which runs on the watcher's queue.
+    private final class DeliveryRecorder: @unchecked Sendable {
+        private let lock = NSLock()
+        private var names: [String] = []
+
+        func record(_ fileURL: URL) {
+            lock.withLock { names.append(fileURL.lastPathComponent) }
+        }
+
+        var delivered: [String] {
+            lock.withLock { names }
+        }
+    }
+
+    /// Settle window used by the tests: ten times the append interval below, so
+    /// a delayed append on a busy machine does not let a file settle early.
+    private static let settleInterval: TimeInterval = 1.0
+    private static let appendInterval: TimeInterval = 0.1
+
+    /// How long to keep watching after a delivery for a duplicate to show up.
+    private static let duplicateWindow: TimeInterval = 0.3
+
+    private var rootURL: URL!
+    private var recorder: DeliveryRecorder!
+    private var watcher: DirectoryWatcher!
+
+    override func setUpWithError() throws {
+        try super.setUpWithError()
+        rootURL = FileManager.default.temporaryDirectory
+            .appendingPathComponent("DirectoryWatcherTests-\(UUID().uuidString)", isDirectory: true)
+        try FileManager.default.createDirectory(at: rootURL, withIntermediateDirectories: true)
+
+        let recorder = DeliveryRecorder()
+        self.recorder = recorder
+        watcher = DirectoryWatcher(settleInterval: Self.settleInterval) { fileURL, _ in
+            recorder.record(fileURL)
+        }
+        try watcher.watch(rootURL)
+    }
+
+    override func tearDown() {
+        watcher.stopAll()
+        watcher = nil
+        recorder = nil
+        try? FileManager.default.removeItem(at: rootURL)
+        rootURL = nil
+        super.tearDown()
+    }
+
+    // MARK: - Helper
+
+    @discardableResult
+    private func makeFile(_ name: String, contents: String = "# Note\n") throws -> URL {
+        let url = rootURL.appendingPathComponent(name)
+        try contents.write(to: url, atomically: false, encoding: .utf8)
+        return url
+    }
+
+    private func append(_ text: String, to url: URL) throws {
+        let handle = try FileHandle(forWritingTo: url)
+        defer { try? handle.close() }
+        try handle.seekToEnd()
+        try handle.write(contentsOf: Data(text.utf8))
+    }
+
+    /// Waits until the handler has been called `count` times in total.
+    private func waitForDeliveries(_ count: Int, timeout: TimeInterval = 5) {
+        let recorder = recorder!
+        let delivered = expectation(
+            for: NSPredicate { _, _ in recorder.delivered.count >= count },
+            evaluatedWith: nil
+        )
+        wait(for: [delivered], timeout: timeout)
+    }
+
+    // MARK: - Delivery
+
+    func test_settledFile_deliveredOnce() throws {
+        try makeFile("note.md")
+
+        waitForDeliveries(1)
+        Thread.sleep(forTimeInterval: Self.duplicateWindow)
+
+        XCTAssertEqual(recorder.delivered, ["note.md"])
+    }
+
+    func test_fileBeingWritten_heldUntilQuiet() throws {
+        let file = try makeFile("draft.md")
+
+        // Keep the modification time fresh for longer than one settle interval.
+        for line in 1...12 {
+            Thread.sleep(forTimeInterval: Self.appendInterval)
+            try append("line \(line)\n", to: file)
+            XCTAssertTrue(recorder.delivered.isEmpty, "delivered while still being written (line \(line))")
+        }
+
+        waitForDeliveries(1, timeout: 3)
+        XCTAssertEqual(recorder.delivered, ["draft.md"])
+    }
+
+    func test_fileRecreatedWhileSettling_deliveredOnce() throws {
+        // An atomic save removes the file and puts a new one in its place.
+        // The pauses let the watcher see the removal and the re-add as
+        // separate events, all within one settle window.
+        let file = try makeFile("note.md")
+        Thread.sleep(forTimeInterval: 0.1)
+        try FileManager.default.removeItem(at: file)
+        Thread.sleep(forTimeInterval: 0.1)
+        try makeFile("note.md", contents: "# Note\n\nSaved again.\n")
+
+        waitForDeliveries(1)
+        Thread.sleep(forTimeInterval: Self.duplicateWindow)
+
+        XCTAssertEqual(recorder.delivered, ["note.md"])
+    }
+
+    func test_nonMarkdownFile_isIgnored() throws {
+        try makeFile("image.png", contents: "")
+        try makeFile("note.md")
+
+        waitForDeliveries(1)
+        Thread.sleep(forTimeInterval: Self.duplicateWindow)
+
+        XCTAssertEqual(recorder.delivered, ["note.md"])
+    }
+}
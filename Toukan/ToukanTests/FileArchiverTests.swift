@@ -0,0 +1,106 @@
+import XCTest
+@testable import Toukan
+
+final class FileArchiverTests: XCTestCase {
+
+    /// Temporary folder shared by the whole class, removed once after the last test.
+    nonisolated(unsafe) private static var sharedRootURL: URL!
+
+    /// This test's own folder inside ``sharedRootURL``.
+    private var rootURL: URL!
+
+    override class func setUp() {
+        super.setUp()
+        sharedRootURL = FileManager.default.temporaryDirectory
+            .appendingPathComponent("FileArchiverTests-\(UUID().uuidString)", isDirectory: true)
+    }
+
+    override class func tearDown() {
+        try? FileManager.default.removeItem(at: sharedRootURL)
+        sharedRootURL = nil
+        super.tearDown()
+    }
+
+    override func setUpWithError() throws {
+        try super.setUpWithError()
+        // A fresh subfolder keeps tests isolated; only one tree is deleted at the end.
+        rootURL = Self.sharedRootURL.appendingPathComponent(UUID().uuidString, isDirectory: true)
+        try FileManager.default.createDirectory(at: rootURL, withIntermediateDirectories: true)
+    }
+
+    override func tearDown() {
+        rootURL = nil
+        super.tearDown()
+    }
+
+    // MARK: - Helper
+
+    private func makeFile(_ name: String, contents: String) throws -> URL {
+        let url = rootURL.appendingPathComponent(name)
+        try contents.write(to: url, atomically: false, encoding: .utf8)
+        return url
+    }
+
+    private var archiveURL: URL {
+        rootURL.appendingPathComponent("archived", isDirectory: true)
+    }
+
+    // MARK: - Archive
+
+    func test_archive_movesFileIntoPreparedDirectory() throws {
+        let file = try makeFile("note.md", contents: "# Note")
+        try FileArchiver.prepare(archiveURL)
+
+        let destination = try FileArchiver.archive(file, into: archiveURL)
+
+        XCTAssertEqual(destination.lastPathComponent, "note.md")
+        XCTAssertFalse(FileManager.default.fileExists(atPath: file.path))
+        XCTAssertEqual(try String(contentsOf: destination, encoding: .utf8), "# Note")
+    }
+
+    func test_archive_sameVolume_renamesWithoutCopying() throws {
+        let file = try makeFile("note.md", contents: "body")
+        try FileArchiver.prepare(archiveURL)
+        let inodeBefore = try FileManager.default.attributesOfItem(atPath: file.path)[.systemFileNumber] as? Int
+
+        let destination = try FileArchiver.archive(file, into: archiveURL)
+
+        // A rename keeps the inode; a copy-and-delete would allocate a new one.
+        let inodeAfter = try FileManager.default.attributesOfItem(atPath: destination.path)[.systemFileNumber] as? Int
+        XCTAssertNotNil(inodeBefore)
+        XCTAssertEqual(inodeAfter, inodeBefore)
+    }
+
+    func test_archive_createsMissingDirectory() throws {
+        let file = try makeFile("note.md", contents: "body")
+
+        let destination = try FileArchiver.archive(file, into: archiveURL)
+
+        XCTAssertTrue(FileManager.default.fileExists(atPath: destination.path))
+        XCTAssertFalse(FileManager.default.fileExists(atPath: file.path))
+    }
+
+    func test_archive_replacesExistingFile() throws {
+        try FileArchiver.prepare(archiveURL)
+        try "old".write(to: archiveURL.appendingPathComponent("note.md"), atomically: false, encoding: .utf8)
+        let file = try makeFile("note.md", contents: "new")
+
+        let destination = try FileArchiver.archive(file, into: archiveURL)
+
+        XCTAssertEqual(try String(contentsOf: destination, encoding: .utf8), "new")
+    }
+
+    func test_archive_missingSource_throws() throws {
+        try FileArchiver.prepare(archiveURL)
+        let missing = rootURL.appendingPathComponent("missing.md")
+
+        XCTAssertThrowsError(try FileArchiver.archive(missing, into: archiveURL))
+    }
+
+    // MARK: - Prepare
+
+    func test_prepare_isIdempotent() throws {
+        try FileArchiver.prepare(archiveURL)
+        XCTAssertNoThrow(try FileArchiver.prepare(archiveURL))
+    }
+}
@@ -31,36 +31,23 @@ final class MarkdownParserTests: XCTestCase {
         XCTAssertTrue(blocks.isEmpty)
     }
 
-    // MARK: - Headings
-
-    func test_heading1_parsesCorrectly() throws {
-        let blocks = parser.parse("# Heading 1")
-        XCTAssertEqual(blocks.count, 1)
-        XCTAssertEqual(blocks[0].type, .heading1)
-        XCTAssertEqual(try textContent(of: blocks[0]), "Heading 1")
-    }
-
-    func test_heading2_parsesCorrectly() throws {
-        let blocks = parser.parse("## Heading 2")
-        XCTAssertEqual(blocks.count, 1)
-        XCTAssertEqual(blocks[0].type, .heading2)
-        XCTAssertEqual(try textContent(of: blocks[0]), "Heading 2")
-    }
-
-    func test_heading3_parsesCorrectly() throws {
-        let blocks = parser.parse("### Heading 3")
-        XCTAssertEqual(blocks.count, 1)
-        XCTAssertEqual(blocks[0].type, .heading3)
-        XCTAssertEqual(try textContent(of: blocks[0]), "Heading 3")
-    }
-
-    // MARK: - Paragraph
-
-    func test_paragraph_parsesCorrectly() throws {
-        let blocks = parser.parse("This is a paragraph.")
-        XCTAssertEqual(blocks.count, 1)
-        XCTAssertEqual(blocks[0].type, .paragraph)
-        XCTAssertEqual(try textContent(of: blocks[0]), "This is a paragraph.")
+    // MARK: - Single Element
+
+    func test_singleLine_parsesToExpectedBlock() throws {
+        let cases: [(input: String, type: NotionBlock.BlockType, text: String)] = [
+            ("# Heading 1", .heading1, "Heading 1"),
+            ("## Heading 2", .heading2, "Heading 2"),
+            ("### Heading 3", .heading3, "Heading 3"),
+            ("#### Heading 4", .paragraph, "#### Heading 4"),
+            ("This is a paragraph.", .paragraph, "This is a paragraph."),
+        ]
+
+        for (input, type, text) in cases {
+            let blocks = parser.parse(input)
+            XCTAssertEqual(blocks.count, 1, input)
+            XCTAssertEqual(blocks.first?.type, type, input)
+            XCTAssertEqual(try blocks.first.map(textContent(of:)), text, input)
+        }
     }
 
     // MARK: - Multiple Elements
@@ -75,53 +62,71 @@ final class MarkdownParserTests: XCTestCase {
 
     // MARK: - Truncation
 
-    func test_longText_truncatesAt2000() throws {
-        let input = String(repeating: "a", count: 2500)
-        let blocks = parser.parse(input)
-        XCTAssertEqual(blocks.count, 1)
-        XCTAssertEqual(blocks[0].type, .paragraph)
-        let content = try textContent(of: blocks[0])
-        XCTAssertEqual(content.count, 2000)
-        XCTAssertTrue(content.hasSuffix("..."))
+    func test_paragraphLength_truncatesOnlyAbove2000() throws {
+        let cases: [(length: Int, truncated: Bool)] = [
+            (1999, false),
+            (2000, false),
+            (2001, true),
+            (2500, true),
+            (10000, true),
+        ]
+
+        for (length, truncated) in cases {
+            let input = String(repeating: "a", count: length)
+            let blocks = parser.parse(input)
+            XCTAssertEqual(blocks.count, 1, "length \(length)")
+            XCTAssertEqual(blocks.first?.type, .paragraph, "length \(length)")
+
+            let content = try textContent(of: blocks[0])
+            if truncated {
+                XCTAssertEqual(content.count, 2000, "length \(length)")
+                XCTAssertEqual(content, String(repeating: "a", count: 1997) + "...", "length \(length)")
+            } else {
+                XCTAssertEqual(content, input, "length \(length)")
+            }
+        }
     }
 
-    func test_textExactly2000_notTruncated() throws {
-        let input = String(repeating: "a", count: 2000)
-        let blocks = parser.parse(input)
+    // MARK: - Line Merging
+
+    func test_consecutiveLines_mergeIntoParagraph() throws {
+        let blocks = parser.parse("line1\nline2\nline3")
         XCTAssertEqual(blocks.count, 1)
         XCTAssertEqual(blocks[0].type, .paragraph)
-        let content = try textContent(of: blocks[0])
-        XCTAssertEqual(content.count, 2000)
-        XCTAssertFalse(content.hasSuffix("..."))
-        XCTAssertEqual(content, String(repeating: "a", count: 2000))
+        XCTAssertEqual(try textContent(of: blocks[0]), "line1\nline2\nline3")
     }
 
-    func test_textExactly2001_truncatesTo2000() throws {
-        let input = String(repeating: "a", count: 2001)
-        let blocks = parser.parse(input)
-        XCTAssertEqual(blocks.count, 1)
-        let content = try textContent(of: blocks[0])
-        XCTAssertEqual(content.count, 2000)
-        XCTAssertTrue(content.hasSuffix("..."))
-        XCTAssertEqual(String(content.prefix(1997)), String(repeating: "a", count: 1997))
+    // MARK: - Trailing Whitespace
+
+    func test_trailingWhitespace_isTrimmed() throws {
+        let blocks = parser.parse("# Title \t\n\nline1  \nline2\u{3000}")
+        XCTAssertEqual(blocks.count, 2)
+        XCTAssertEqual(try textContent(of: blocks[0]), "Title")
+        XCTAssertEqual(try textContent(of: blocks[1]), "line1\nline2")
     }
 
-    func test_textExactly1999_notTruncated() throws {
-        let input = String(repeating: "a", count: 1999)
-        let blocks = parser.parse(input)
-        XCTAssertEqual(blocks.count, 1)
-        let content = try textContent(of: blocks[0])
-        XCTAssertEqual(content.count, 1999)
-        XCTAssertFalse(content.hasSuffix("..."))
+    func test_whitespaceOnlyLine_separatesParagraphs() {
+        let blocks = parser.parse("first\n \t \nsecond")
+        XCTAssertEqual(blocks.count, 2)
+        XCTAssertEqual(blocks[0].type, .paragraph)
+        XCTAssertEqual(blocks[1].type, .paragraph)
     }
 
-    // MARK: - Line Merging
+    // MARK: - Line Endings
 
-    func test_consecutiveLines_mergeIntoParagraph() throws {
-        let blocks = parser.parse("line1\nline2\nline3")
-        XCTAssertEqual(blocks.count, 1)
-        XCTAssertEqual(blocks[0].type, .paragraph)
-        XCTAssertEqual(try textContent(of: blocks[0]), "line1\nline2\nline3")
+    func test_crlfLineEndings_splitLikeLF() throws {
+        let blocks = parser.parse("# Title\r\n\r\nline1\r\nline2\r\n")
+        XCTAssertEqual(blocks.count, 2)
+        XCTAssertEqual(blocks[0].type, .heading1)
+        XCTAssertEqual(try textContent(of: blocks[0]), "Title")
+        XCTAssertEqual(try textContent(of: blocks[1]), "line1\nline2")
+    }
+
+    func test_multibyteText_preservedAcrossLines() throws {
+        let blocks = parser.parse("## 見出し 🐦\n日本語の段落\n二行目")
+        XCTAssertEqual(blocks.count, 2)
+        XCTAssertEqual(try textContent(of: blocks[0]), "見出し 🐦")
+        XCTAssertEqual(try textContent(of: blocks[1]), "日本語の段落\n二行目")
     }
 
     // MARK: - Edge Cases
@@ -133,6 +138,22 @@ final class MarkdownParserTests: XCTestCase {
         XCTAssertEqual(try textContent(of: blocks[0]), "#NoSpace")
     }
 
+    // MARK: - Paragraph-Only Documents
+
+    func test_manyParagraphsWithoutHeadings_allParsedAsParagraphs() throws {
+        let input = (1...1000).map { "Paragraph \($0)" }.joined(separator: "\n\n")
+        let blocks = parser.parse(input)
+        XCTAssertEqual(blocks.count, 1000)
+        XCTAssertTrue(blocks.allSatisfy { $0.type == .paragraph })
+        XCTAssertEqual(try textContent(of: blocks[999]), "Paragraph 1000")
+    }
+
+    func test_headingAfterLongProse_stillDetected() {
+        let prose = String(repeating: "Plain prose without markup. ", count: 20)
+        let blocks = parser.parse(prose + "\n\n# Late Heading")
+        XCTAssertEqual(blocks.map(\.type), [.paragraph, .heading1])
+    }
+
     // MARK: - Complex Document
 
     func test_complexDocument_parsesCorrectly() throws {
@@ -1,66 +1,7 @@
 import XCTest
 @testable import Toukan
 
-// MARK: - MockURLProtocol
-
-final class MockURLProtocol: URLProtocol, @unchecked Sendable {
-    nonisolated(unsafe) static var requestHandler: ((URLRequest) throws -> (HTTPURLResponse, Data))?
-    nonisolated(unsafe) static var lastRequestBody: Data?
-    nonisolated(unsafe) static var capturedRequests: [(url: URL, method: String, body: Data?)] = []
-
-    override class func canInit(with request: URLRequest) -> Bool { true }
-    override class func canonicalRequest(for request: URLRequest) -> URLRequest { request }
-
-    override func startLoading() {
-        // Capture body: URLSession may place it in httpBody or httpBodyStream
-        if let body = request.httpBody {
-            Self.lastRequestBody = body
-        } else if let stream = request.httpBodyStream {
-            stream.open()
-            var data = Data()
-            let buffer = UnsafeMutablePointer<UInt8>.allocate(capacity: 4096)
-            defer { buffer.deallocate() }
-            while stream.hasBytesAvailable {
-                let count = stream.read(buffer, maxLength: 4096)
-                if count > 0 { data.append(buffer, count: count) }
-            }
-            stream.close()
-            Self.lastRequestBody = data
-        }
-
-        Self.capturedRequests.append((url: request.url!, method: request.httpMethod ?? "GET", body: Self.lastRequestBody))
-
-        guard let handler = Self.requestHandler else {
-            client?.urlProtocolDidFinishLoading(self)
-            return
-        }
-        do {
-            let (response, data) = try handler(request)
-            client?.urlProtocol(self, didReceive: response, cacheStoragePolicy: .notAllowed)
-            client?.urlProtocol(self, didLoad: data)
-            client?.urlProtocolDidFinishLoading(self)
-        } catch {
-            client?.urlProtocol(self, didFailWithError: error)
-        }
-    }
-
-    override func stopLoading() {}
-}
-
-// MARK: - Helpers
-
-private func makeResponse(
-    url: URL = URL(string: "https://api.notion.com/v1/pages")!,
-    statusCode: Int,
-    headers: [String: String]? = nil
-) -> HTTPURLResponse {
-    HTTPURLResponse(
-        url: url,
-        statusCode: statusCode,
-        httpVersion: "HTTP/1.1",
-        headerFields: headers
-    )!
-}
+// MARK: - Fixtures
 
 private let successPageJSON = #"{"id":"page-123","url":"https://notion.so/page-123"}"#
     .data(using: .utf8)!
@@ -69,22 +10,20 @@ private let successPageJSON = #"{"id":"page-123","url":"https://notion.so/page-1
 
 final class NotionAPIClientTests: XCTestCase {
     private var client: NotionAPIClient!
-    private var session: URLSession!
+
+    /// One mock-backed session for the whole class. It holds no per-test
+    /// state (that lives in `MockURLProtocol` and is reset in `tearDown`),
+    /// so there is no need to build a new one for every test.
+    private static let session = MockURLProtocol.makeSession()
 
     override func setUp() {
         super.setUp()
-        let config = URLSessionConfiguration.ephemeral
-        config.protocolClasses = [MockURLProtocol.self]
-        session = URLSession(configuration: config)
-        client = NotionAPIClient(token: "test-token", session: session)
+        client = NotionAPIClient(token: "test-token", session: Self.session, retryPolicy: .none, rateLimiter: nil)
     }
 
     override func tearDown() {
-        MockURLProtocol.requestHandler = nil
-        MockURLProtocol.lastRequestBody = nil
-        MockURLProtocol.capturedRequests = []
+        MockURLProtocol.reset()
         client = nil
-        session = nil
         super.tearDown()
     }
 
@@ -123,8 +62,7 @@ final class NotionAPIClientTests: XCTestCase {
             blocks: [.paragraph("text")]
         )
 
-        let bodyData = try XCTUnwrap(MockURLProtocol.lastRequestBody, "Request body should not be nil")
-        let body = try XCTUnwrap(try JSONSerialization.jsonObject(with: bodyData) as? [String: Any])
+        let body = try jsonObject(from: MockURLProtocol.lastRequestBody)
 
         // Verify parent.data_source_id
         let parent = try XCTUnwrap(body["parent"] as? [String: Any])
@@ -157,8 +95,7 @@ final class NotionAPIClientTests: XCTestCase {
             blocks: [.paragraph("text")]
         )
 
-        let bodyData = try XCTUnwrap(MockURLProtocol.lastRequestBody, "Request body should not be nil")
-        let body = try XCTUnwrap(try JSONSerialization.jsonObject(with: bodyData) as? [String: Any])
+        let body = try jsonObject(from: MockURLProtocol.lastRequestBody)
         let properties = try XCTUnwrap(body["properties"] as? [String: Any])
 
         // "Name" key should NOT be present
@@ -187,8 +124,7 @@ final class NotionAPIClientTests: XCTestCase {
             blocks: []
         )
 
-        let bodyData = try XCTUnwrap(MockURLProtocol.lastRequestBody)
-        let body = try XCTUnwrap(try JSONSerialization.jsonObject(with: bodyData) as? [String: Any])
+        let body = try jsonObject(from: MockURLProtocol.lastRequestBody)
         let properties = try XCTUnwrap(body["properties"] as? [String: Any])
         let litNotes = try XCTUnwrap(properties["Lit Notes"] as? [String: Any], "Lit Notes should be present")
         let relation = try XCTUnwrap(litNotes["relation"] as? [[String: Any]])
@@ -468,8 +404,7 @@ final class NotionAPIClientTests: XCTestCase {
         let req1 = MockURLProtocol.capturedRequests[0]
         XCTAssertEqual(req1.method, "POST")
         XCTAssertTrue(req1.url.absoluteString.hasSuffix("/v1/pages"))
-        let body1 = try XCTUnwrap(req1.body)
-        let json1 = try XCTUnwrap(try JSONSerialization.jsonObject(with: body1) as? [String: Any])
+        let json1 = try jsonObject(from: req1.body)
         let children1 = try XCTUnwrap(json1["children"] as? [[String: Any]])
         XCTAssertEqual(children1.count, 100)
 
@@ -477,8 +412,7 @@ final class NotionAPIClientTests: XCTestCase {
         let req2 = MockURLProtocol.capturedRequests[1]
         XCTAssertEqual(req2.method, "PATCH")
         XCTAssertTrue(req2.url.absoluteString.contains("blocks/page-123/children"))
-        let body2 = try XCTUnwrap(req2.body)
-        let json2 = try XCTUnwrap(try JSONSerialization.jsonObject(with: body2) as? [String: Any])
+        let json2 = try jsonObject(from: req2.body)
         let children2 = try XCTUnwrap(json2["children"] as? [[String: Any]])
         XCTAssertEqual(children2.count, 100)
 
@@ -486,8 +420,7 @@ final class NotionAPIClientTests: XCTestCase {
         let req3 = MockURLProtocol.capturedRequests[2]
         XCTAssertEqual(req3.method, "PATCH")
         XCTAssertTrue(req3.url.absoluteString.contains("blocks/page-123/children"))
-        let body3 = try XCTUnwrap(req3.body)
-        let json3 = try XCTUnwrap(try JSONSerialization.jsonObject(with: body3) as? [String: Any])
+        let json3 = try jsonObject(from: req3.body)
         let children3 = try XCTUnwrap(json3["children"] as? [[String: Any]])
         XCTAssertEqual(children3.count, 50)
     }
@@ -511,6 +444,40 @@ final class NotionAPIClientTests: XCTestCase {
         XCTAssertEqual(MockURLProtocol.capturedRequests[0].method, "POST")
     }
 
+    // MARK: - 13b. Chunk boundaries: one request per 100 blocks
+
+    func test_createPage_chunkBoundaries_sendOneRequestPer100Blocks() async throws {
+        MockURLProtocol.requestHandler = { _ in
+            return (makeResponse(statusCode: 200), successPageJSON)
+        }
+
+        let cases: [(blocks: Int, childCounts: [Int])] = [
+            (101, [100, 1]),
+            (200, [100, 100]),
+            (201, [100, 100, 1]),
+        ]
+
+        for (blockCount, expected) in cases {
+            MockURLProtocol.capturedRequests = []
+
+            _ = try await client.createPage(
+                dataSourceId: "ds-123",
+                title: "Test",
+                titlePropertyName: "Name",
+                litNoteId: nil,
+                blocks: makeBlocks(blockCount)
+            )
+
+            let childCounts = try MockURLProtocol.capturedRequests.map { request -> Int in
+                let json = try jsonObject(from: request.body)
+                return try XCTUnwrap(json["children"] as? [[String: Any]]).count
+            }
+            XCTAssertEqual(childCounts, expected, "\(blockCount) blocks")
+            XCTAssertEqual(MockURLProtocol.capturedRequests.first?.method, "POST")
+            XCTAssertTrue(MockURLProtocol.capturedRequests.dropFirst().allSatisfy { $0.method == "PATCH" })
+        }
+    }
+
     // MARK: - 14. appendBlocks sends PATCH with correct body
 
     func test_appendBlocks_sendsPATCH_withCorrectBody() async throws {
@@ -525,8 +492,7 @@ final class NotionAPIClientTests: XCTestCase {
         XCTAssertEqual(req.method, "PATCH")
         XCTAssertTrue(req.url.absoluteString.contains("blocks/block-456/children"))
 
-        let bodyData = try XCTUnwrap(req.body)
-        let json = try XCTUnwrap(try JSONSerialization.jsonObject(with: bodyData) as? [String: Any])
+        let json = try jsonObject(from: req.body)
         let children = try XCTUnwrap(json["children"] as? [[String: Any]])
         XCTAssertEqual(children.count, 3)
     }
@@ -563,4 +529,145 @@ final class NotionAPIClientTests: XCTestCase {
         }
     }
 
+    // MARK: - 16. Retries
+
+    private func makeRetryingClient(maxAttempts: Int = 3) -> NotionAPIClient {
+        NotionAPIClient(
+            token: "test-token",
+            session: Self.session,
+            retryPolicy: .init(maxAttempts: maxAttempts, baseDelay: 0.01, maxDelay: 0.01),
+            rateLimiter: nil
+        )
+    }
+
+    func test_createPage_retriesTransientErrorThenSucceeds() async throws {
+        var callCount = 0
+        MockURLProtocol.requestHandler = { _ in
+            callCount += 1
+            if callCount == 1 {
+                return (makeResponse(statusCode: 429, headers: ["Retry-After": "0"]), Data())
+            }
+            if callCount == 2 {
+                return (makeResponse(statusCode: 502), Data())
+            }
+            return (makeResponse(statusCode: 200), successPageJSON)
+        }
+
+        let page = try await makeRetryingClient().createPage(
+            dataSourceId: "ds-123",
+            title: "Test",
+            titlePropertyName: "Name",
+            litNoteId: nil,
+            blocks: []
+        )
+
+        XCTAssertEqual(page.id, "page-123")
+        XCTAssertEqual(MockURLProtocol.capturedRequests.count, 3)
+    }
+
+    func test_createPage_doesNotRetryValidationError() async throws {
+        MockURLProtocol.requestHandler = { _ in
+            return (makeResponse(statusCode: 400), Data(#"{"message":"Invalid"}"#.utf8))
+        }
+
+        do {
+            _ = try await makeRetryingClient().createPage(
+                dataSourceId: "ds-123",
+                title: "Test",
+                titlePropertyName: "Name",
+                litNoteId: nil,
+                blocks: []
+            )
+            XCTFail("Expected NotionAPIError.validationError to be thrown")
+        } catch let error as NotionAPIError {
+            guard case .validationError = error else {
+                XCTFail("Expected .validationError, got \(error)")
+                return
+            }
+        }
+        XCTAssertEqual(MockURLProtocol.capturedRequests.count, 1)
+    }
+
+    func test_createPage_retriesExhausted_throwsLastError() async throws {
+        MockURLProtocol.requestHandler = { _ in
+            return (makeResponse(statusCode: 503), Data())
+        }
+
+        do {
+            _ = try await makeRetryingClient(maxAttempts: 3).createPage(
+                dataSourceId: "ds-123",
+                title: "Test",
+                titlePropertyName: "Name",
+                litNoteId: nil,
+                blocks: []
+            )
+            XCTFail("Expected NotionAPIError.serverError to be thrown")
+        } catch let error as NotionAPIError {
+            guard case .serverError(let statusCode) = error else {
+                XCTFail("Expected .serverError, got \(error)")
+                return
+            }
+            XCTAssertEqual(statusCode, 503)
+        }
+        XCTAssertEqual(MockURLProtocol.capturedRequests.count, 3)
+    }
+
+    func test_createPage_timedOut_isNotRetried() async throws {
+        // The request may have reached Notion before timing out; resending it
+        // could create the page twice.
+        MockURLProtocol.requestHandler = { _ in
+            throw URLError(.timedOut)
+        }
+
+        do {
+            _ = try await makeRetryingClient().createPage(
+                dataSourceId: "ds-123",
+                title: "Test",
+                titlePropertyName: "Name",
+                litNoteId: nil,
+                blocks: []
+            )
+            XCTFail("Expected NotionAPIError.networkError to be thrown")
+        } catch let error as NotionAPIError {
+            guard case .networkError = error else {
+                XCTFail("Expected .networkError, got \(error)")
+                return
+            }
+        }
+        XCTAssertEqual(MockURLProtocol.capturedRequests.count, 1)
+    }
+
+    func test_retryPolicy_prefersRetryAfter() {
+        let policy = NotionAPIClient.RetryPolicy.default
+        XCTAssertEqual(policy.delay(afterAttempt: 1, retryAfter: 7), 7)
+        XCTAssertLessThanOrEqual(policy.delay(afterAttempt: 10, retryAfter: nil), policy.maxDelay)
+    }
+
+    // MARK: - 17. Rate limiting
+
+    func test_createPage_rateLimiter_pacesAppendRequests() async throws {
+        MockURLProtocol.requestHandler = { _ in
+            return (makeResponse(statusCode: 200), successPageJSON)
+        }
+        let pacedClient = NotionAPIClient(
+            token: "test-token",
+            session: Self.session,
+            retryPolicy: .none,
+            rateLimiter: RateLimiter(requestsPerSecond: 20, burst: 1)
+        )
+
+        let start = ContinuousClock.now
+        _ = try await pacedClient.createPage(
+            dataSourceId: "ds-123",
+            title: "Test",
+            titlePropertyName: "Name",
+            litNoteId: nil,
+            blocks: makeBlocks(250)
+        )
+        let elapsed = start.duration(to: .now)
+
+        // Three requests with a burst of one: the 2nd and 3rd each wait 50 ms.
+        XCTAssertEqual(MockURLProtocol.capturedRequests.count, 3)
+        XCTAssertGreaterThanOrEqual(elapsed, .milliseconds(95))
+    }
 }
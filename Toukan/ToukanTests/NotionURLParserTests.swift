@@ -57,6 +57,26 @@ final class NotionURLParserTests: XCTestCase {
         XCTAssertEqual(result, "a1b2c3d4-e5f6-7890-abcd-ef1234567890")
     }
 
+    func test_hexRunLongerThan32_extractsTrailingId() {
+        let input = "https://www.notion.so/Cafe0a1b2c3d4e5f67890abcdef1234567890"
+        let result = NotionURLParser.extractDatabaseId(from: input)
+        XCTAssertEqual(result, "a1b2c3d4-e5f6-7890-abcd-ef1234567890")
+    }
+
+    // MARK: - isDashedUUID
+
+    func test_isDashedUUID_acceptsEitherCase() {
+        XCTAssertTrue(NotionURLParser.isDashedUUID("a1b2c3d4-e5f6-7890-abcd-ef1234567890"))
+        XCTAssertTrue(NotionURLParser.isDashedUUID("A1B2C3D4-E5F6-7890-ABCD-EF1234567890"))
+    }
+
+    func test_isDashedUUID_rejectsOtherForms() {
+        XCTAssertFalse(NotionURLParser.isDashedUUID("a1b2c3d4e5f67890abcdef1234567890"))
+        XCTAssertFalse(NotionURLParser.isDashedUUID("a1b2c3d4-e5f6-7890-abcd-ef1234567890/"))
+        XCTAssertFalse(NotionURLParser.isDashedUUID("g1b2c3d4-e5f6-7890-abcd-ef1234567890"))
+        XCTAssertFalse(NotionURLParser.isDashedUUID(""))
+    }
+
     // MARK: - formatAsUUID
 
     func test_formatAsUUID_insertsCorrectDashes() {
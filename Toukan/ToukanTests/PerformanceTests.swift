@@ -0,0 +1,67 @@
+import XCTest
+@testable import Toukan
+
+/// Timing tests for the per-file hot paths: Markdown parsing and block encoding.
+///
+/// Each test runs its workload under `measure`, so Xcode can record a
+/// baseline per machine and flag runs that regress against it. Timings are
+/// only meaningful on a quiet machine with no other tests running alongside,
+/// so the class is skipped unless `TOUKAN_PERF_TESTS=1` is set; see the
+/// README for running it on its own.
+final class PerformanceTests: XCTestCase {
+
+    private let parser = MarkdownParser()
+
+    override func setUpWithError() throws {
+        try super.setUpWithError()
+        try XCTSkipUnless(
+            ProcessInfo.processInfo.environment["TOUKAN_PERF_TESTS"] == "1",
+            "Set TOUKAN_PERF_TESTS=1 to run performance tests"
+        )
+    }
+
+    /// A note mixing headings and short paragraphs, 400 blocks in total.
+    private static let mixedDocument = String(repeating: "# Heading\n\nParagraph text\n\n", count: 200)
+
+    /// A prose-only note of 1000 multi-line paragraphs.
+    private static let proseDocument = (1...1000)
+        .map { "Paragraph \($0), first line.\nSecond line of paragraph \($0)." }
+        .joined(separator: "\n\n")
+
+    // MARK: - Parsing
+
+    func test_parse_mixedDocument() {
+        measure(metrics: [XCTClockMetric()]) {
+            for _ in 0..<10 {
+                XCTAssertEqual(parser.parse(Self.mixedDocument).count, 400)
+            }
+        }
+    }
+
+    func test_parse_proseDocument() {
+        measure(metrics: [XCTClockMetric()]) {
+            for _ in 0..<10 {
+                XCTAssertEqual(parser.parse(Self.proseDocument).count, 1000)
+            }
+        }
+    }
+
+    func test_parse_longParagraphTruncation() {
+        let longParagraph = String(repeating: "x", count: 500_000)
+        measure(metrics: [XCTClockMetric()]) {
+            XCTAssertEqual(parser.parse(longParagraph).count, 1)
+        }
+    }
+
+    // MARK: - Encoding
+
+    func test_encode_blocks() throws {
+        let blocks = parser.parse(Self.mixedDocument)
+        let encoder = JSONEncoder()
+        measure(metrics: [XCTClockMetric()]) {
+            for _ in 0..<10 {
+                XCTAssertNoThrow(try encoder.encode(blocks))
+            }
+        }
+    }
+}
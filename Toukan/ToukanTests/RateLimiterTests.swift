@@ -0,0 +1,57 @@
+import XCTest
+@testable import Toukan
+
+final class RateLimiterTests: XCTestCase {
+
+    // MARK: - TokenBucket
+
+    func test_burst_doesNotWait() {
+        var bucket = TokenBucket(rate: 3, capacity: 3)
+        for _ in 0..<3 {
+            XCTAssertEqual(bucket.reserve(at: 0), 0)
+        }
+    }
+
+    func test_beyondBurst_waitsOneIntervalPerRequest() {
+        var bucket = TokenBucket(rate: 3, capacity: 3)
+        let waits = (0..<6).map { _ in bucket.reserve(at: 0) }
+        XCTAssertEqual(waits[3], 1.0 / 3, accuracy: 1e-9)
+        XCTAssertEqual(waits[4], 2.0 / 3, accuracy: 1e-9)
+        XCTAssertEqual(waits[5], 1.0, accuracy: 1e-9)
+    }
+
+    func test_manyRequests_totalWaitCoversSustainedRate() {
+        var bucket = TokenBucket(rate: 2.5, capacity: 3)
+        let requests = 20
+        let lastWait = (0..<requests).map { _ in bucket.reserve(at: 0) }.last!
+        // The last request may not go out before (N - burst) / rate seconds.
+        XCTAssertEqual(lastWait, Double(requests - 3) / 2.5, accuracy: 1e-9)
+    }
+
+    func test_refill_restoresTokensOverTime() {
+        var bucket = TokenBucket(rate: 3, capacity: 3)
+        for _ in 0..<3 {
+            _ = bucket.reserve(at: 0)
+        }
+        XCTAssertEqual(bucket.reserve(at: 1.0 / 3), 0)
+        XCTAssertGreaterThan(bucket.reserve(at: 1.0 / 3), 0)
+    }
+
+    func test_refill_isCappedAtCapacity() {
+        var bucket = TokenBucket(rate: 3, capacity: 3)
+        _ = bucket.reserve(at: 0)
+        let waits = (0..<4).map { _ in bucket.reserve(at: 100) }
+        XCTAssertEqual(waits[0..<3].reduce(0, +), 0)
+        XCTAssertEqual(waits[3], 1.0 / 3, accuracy: 1e-9)
+    }
+
+    // MARK: - RateLimiter
+
+    func test_acquire_withinBurst_returnsImmediately() async throws {
+        let limiter = RateLimiter(requestsPerSecond: 1, burst: 2)
+        let start = ContinuousClock.now
+        try await limiter.acquire()
+        try await limiter.acquire()
+        XCTAssertLessThan(start.duration(to: .now), .milliseconds(500))
+    }
+}
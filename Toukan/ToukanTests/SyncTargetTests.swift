@@ -36,4 +36,57 @@ final class SyncTargetTests: XCTestCase {
     func test_dotsOnly_returnsDefault() {
         XCTAssertEqual(SyncTarget.sanitiseArchiveDirName("..."), "archived")
     }
+
+    // MARK: - Codable
+
+    /// A target as persisted before `archiveDirName` existed.
+    private let legacyJSON = Data("""
+        [{"id": "7C9E6679-7425-40DE-944B-E07FC1F90AE7", "displayName": "Notes", "bookmarkData": "AAEC"}]
+        """.utf8)
+
+    func test_decode_legacyTarget_defaultsArchiveDirName() throws {
+        let targets = try JSONDecoder().decode([SyncTarget].self, from: legacyJSON)
+        XCTAssertEqual(targets.count, 1)
+        XCTAssertEqual(targets[0].displayName, "Notes")
+        XCTAssertNil(targets[0].noteId)
+        XCTAssertEqual(targets[0].archiveDirName, "archived")
+        XCTAssertEqual(targets[0].bookmarkData, Data([0, 1, 2]))
+    }
+
+    func test_decode_sanitisesArchiveDirName() throws {
+        let json = Data("""
+            {"id": "7C9E6679-7425-40DE-944B-E07FC1F90AE7", "displayName": "Notes",
+             "archiveDirName": "../done", "bookmarkData": "AAEC"}
+            """.utf8)
+        let target = try JSONDecoder().decode(SyncTarget.self, from: json)
+        XCTAssertEqual(target.archiveDirName, "done")
+    }
+
+    /// Coder pairs a target list must round-trip through. BookmarkManager persists
+    /// with default JSON coders; the binary property list pair catches Codable
+    /// changes that would only happen to work for JSON.
+    private let contenders: [(name: String, roundTrip: ([SyncTarget]) throws -> [SyncTarget])] = [
+        ("JSON", { try JSONDecoder().decode([SyncTarget].self, from: JSONEncoder().encode($0)) }),
+        ("binary plist", { targets in
+            let encoder = PropertyListEncoder()
+            encoder.outputFormat = .binary
+            return try PropertyListDecoder().decode([SyncTarget].self, from: encoder.encode(targets))
+        }),
+    ]
+
+    func test_encodeDecode_roundTrips() throws {
+        var targets = try JSONDecoder().decode([SyncTarget].self, from: legacyJSON)
+        targets[0].noteId = "abc123"
+        targets[0].archiveDirName = "done"
+
+        for (name, roundTrip) in contenders {
+            let decoded = try roundTrip(targets)
+
+            XCTAssertEqual(decoded.count, 1, name)
+            XCTAssertEqual(decoded.first?.id, targets[0].id, name)
+            XCTAssertEqual(decoded.first?.noteId, "abc123", name)
+            XCTAssertEqual(decoded.first?.archiveDirName, "done", name)
+            XCTAssertEqual(decoded.first?.bookmarkData, targets[0].bookmarkData, name)
+        }
+    }
 }
@@ -0,0 +1,89 @@
+import XCTest
+
+// MARK: - MockURLProtocol
+
+final class MockURLProtocol: URLProtocol, @unchecked Sendable {
+    nonisolated(unsafe) static var requestHandler: ((URLRequest) throws -> (HTTPURLResponse, Data))?
+    nonisolated(unsafe) static var lastRequestBody: Data?
+    nonisolated(unsafe) static var capturedRequests: [(url: URL, method: String, body: Data?)] = []
+
+    override class func canInit(with request: URLRequest) -> Bool { true }
+    override class func canonicalRequest(for request: URLRequest) -> URLRequest { request }
+
+    /// An ephemeral session whose requests are all served by this protocol.
+    static func makeSession() -> URLSession {
+        let config = URLSessionConfiguration.ephemeral
+        config.protocolClasses = [MockURLProtocol.self]
+        return URLSession(configuration: config)
+    }
+
+    /// Clears the handler and everything captured so far. Call from `tearDown`.
+    static func reset() {
+        requestHandler = nil
+        lastRequestBody = nil
+        capturedRequests = []
+    }
+
+    override func startLoading() {
+        // Capture body: URLSession may place it in httpBody or httpBodyStream.
+        // A request without a body records nil rather than the previous body.
+        let body = request.httpBody ?? request.httpBodyStream.map(Self.readAll(from:))
+        Self.lastRequestBody = body
+        Self.capturedRequests.append((url: request.url!, method: request.httpMethod ?? "GET", body: body))
+
+        guard let handler = Self.requestHandler else {
+            client?.urlProtocolDidFinishLoading(self)
+            return
+        }
+        do {
+            let (response, data) = try handler(request)
+            client?.urlProtocol(self, didReceive: response, cacheStoragePolicy: .notAllowed)
+            client?.urlProtocol(self, didLoad: data)
+            client?.urlProtocolDidFinishLoading(self)
+        } catch {
+            client?.urlProtocol(self, didFailWithError: error)
+        }
+    }
+
+    override func stopLoading() {}
+
+    private static func readAll(from stream: InputStream) -> Data {
+        stream.open()
+        defer { stream.close() }
+        var data = Data()
+        var buffer = [UInt8](repeating: 0, count: 4096)
+        while stream.hasBytesAvailable {
+            let count = stream.read(&buffer, maxLength: buffer.count)
+            guard count > 0 else { break }
+            data.append(buffer, count: count)
+        }
+        return data
+    }
+}
+
+// MARK: - Helpers
+
+func makeResponse(
+    url: URL = URL(string: "https://api.notion.com/v1/pages")!,
+    statusCode: Int,
+    headers: [String: String]? = nil
+) -> HTTPURLResponse {
+    HTTPURLResponse(
+        url: url,
+        statusCode: statusCode,
+        httpVersion: "HTTP/1.1",
+        headerFields: headers
+    )!
+}
+
+/// Parses a captured request body as a JSON object, failing the test if it is
+/// missing or not an object.
+func jsonObject(
+    from body: Data?,
+    file: StaticString = #filePath,
+    line: UInt = #line
+) throws -> [String: Any] {
+    let data = try XCTUnwrap(body, "Request body should not be nil", file: file, line: line)
+    let object = try JSONSerialization.jsonObject(with: data)
+    return try XCTUnwrap(object as? [String: Any], "Request body should be a JSON object", file: file, line: line)
+}
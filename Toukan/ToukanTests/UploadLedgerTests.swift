@@ -0,0 +1,41 @@
+import XCTest
+@testable import Toukan
+
+final class UploadLedgerTests: XCTestCase {
+
+    private let path = "/tmp/notes/note.md"
+    private let digest = Data([0x01, 0x02, 0x03])
+
+    func test_unknownPath_isNotUploaded() {
+        let ledger = UploadLedger()
+        XCTAssertFalse(ledger.hasEntry(at: path))
+        XCTAssertFalse(ledger.isUploaded(digest, at: path))
+    }
+
+    func test_recordedUpload_sameContent_isUploaded() {
+        var ledger = UploadLedger()
+        ledger.recordUpload(digest, at: path)
+        XCTAssertTrue(ledger.hasEntry(at: path))
+        XCTAssertTrue(ledger.isUploaded(digest, at: path))
+    }
+
+    func test_recordedUpload_changedContent_isNotUploaded() {
+        var ledger = UploadLedger()
+        ledger.recordUpload(digest, at: path)
+        XCTAssertFalse(ledger.isUploaded(Data([0xFF]), at: path))
+    }
+
+    func test_recordedUpload_otherPath_isNotUploaded() {
+        var ledger = UploadLedger()
+        ledger.recordUpload(digest, at: path)
+        XCTAssertFalse(ledger.isUploaded(digest, at: "/tmp/notes/other.md"))
+    }
+
+    func test_archive_forgetsUpload() {
+        var ledger = UploadLedger()
+        ledger.recordUpload(digest, at: path)
+        ledger.recordArchive(at: path)
+        XCTAssertFalse(ledger.hasEntry(at: path))
+        XCTAssertFalse(ledger.isUploaded(digest, at: path))
+    }
+}